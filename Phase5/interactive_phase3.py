@@ -2,6 +2,9 @@ import tkinter as tk
 from tkinter import scrolledtext, ttk, messagebox
 from phase5 import Phase3Simulator
 
+RUN_BATCH = 100  # Instructions executed between redraws while running
+LOG_DISPLAY_LINES = 50  # Most recent log entries kept in the log widget
+
 class InteractiveSimulatorGUI:
     def __init__(self, master):
         self.master = master
@@ -9,6 +12,14 @@ class InteractiveSimulatorGUI:
 
         self.sim = Phase3Simulator()
 
+        # What the widgets currently show, so redraws only touch what changed
+        self._var_shadow = {}
+        self._reg_rows = []
+        self._stack_shown = None
+        self._log_source = None
+        self._log_consumed = 0
+        self._log_lines = 0
+
         self._create_widgets()
         self._update_displays()
 
@@ -63,28 +74,56 @@ class InteractiveSimulatorGUI:
         self.log_display = scrolledtext.ScrolledText(log_frame, width=50)
         self.log_display.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
 
+    def _set_var(self, var, value):
+        # StringVar.set redraws its label, so skip values that are already shown
+        if self._var_shadow.get(id(var)) != value:
+            var.set(value)
+            self._var_shadow[id(var)] = value
+
     def _update_displays(self):
-        self.pc_var.set(f"PC: 0x{self.sim.state.pc:08X}")
-        self.flags_var.set(f"Flags: {self.sim.state.flags}")
-
-        self.register_display.delete(1.0, tk.END)
-        for i in range(0, len(self.sim.state.registers), 4):
-            regs = [
-                f"R{i + j}: 0x{self.sim.state.registers[i + j]:08X}"
-                for j in range(4) if (i + j) < len(self.sim.state.registers)
-            ]
-            self.register_display.insert(tk.END, "  ".join(regs) + "\n")
-
-        self.stack_display.delete(1.0, tk.END)
-        if self.sim.state.stack:
-            for item in reversed(self.sim.state.stack):
-                self.stack_display.insert(tk.END, f"0x{item:08X}\n")
+        state = self.sim.state
+        self._set_var(self.pc_var, f"PC: 0x{state.pc:08X}")
+        self._set_var(self.flags_var, f"Flags: {state.flags}")
+
+        registers = state.registers
+        rows = [
+            "  ".join(f"R{j}: 0x{registers[j]:08X}" for j in range(i, min(i + 4, len(registers))))
+            for i in range(0, len(registers), 4)
+        ]
+        if len(rows) != len(self._reg_rows):
+            self.register_display.delete(1.0, tk.END)
+            self.register_display.insert(tk.END, "".join(row + "\n" for row in rows))
         else:
-            self.stack_display.insert(tk.END, "<empty>\n")
-
-        self.log_display.delete(1.0, tk.END)
-        for entry in self.sim.log[-50:]:
-            self.log_display.insert(tk.END, entry + "\n")
+            for i, row in enumerate(rows):
+                if row != self._reg_rows[i]:
+                    self.register_display.replace(f"{i + 1}.0", f"{i + 1}.end", row)
+        self._reg_rows = rows
+
+        stack = tuple(state.stack)
+        if stack != self._stack_shown:
+            self._stack_shown = stack
+            self.stack_display.delete(1.0, tk.END)
+            if stack:
+                self.stack_display.insert(tk.END, "".join(f"0x{item:08X}\n" for item in reversed(stack)))
+            else:
+                self.stack_display.insert(tk.END, "<empty>\n")
+
+        # The log only grows until the simulator is reset, so append just the new entries
+        log = self.sim.log
+        if log is not self._log_source or len(log) < self._log_consumed:
+            self.log_display.delete(1.0, tk.END)
+            self._log_source = log
+            self._log_consumed = 0
+            self._log_lines = 0
+        new_entries = log[self._log_consumed:][-LOG_DISPLAY_LINES:]
+        self._log_consumed = len(log)
+        if new_entries:
+            self.log_display.insert(tk.END, "".join(entry + "\n" for entry in new_entries))
+            self._log_lines += len(new_entries)
+            excess = self._log_lines - LOG_DISPLAY_LINES
+            if excess > 0:
+                self.log_display.delete("1.0", f"{excess + 1}.0")
+                self._log_lines -= excess
 
     def _step_program(self):
         if self.sim.state.halted:
@@ -98,14 +137,21 @@ class InteractiveSimulatorGUI:
 
     def _run_program(self):
         def run_step():
-            if not self.sim.state.halted:
-                try:
-                    self.sim.fetch()
-                    self.sim.decode_execute()
-                    self._update_displays()
-                    self.master.after(50, run_step)
-                except Exception as e:
-                    messagebox.showerror("Simulator Error", str(e))
+            # Execute a batch of instructions per redraw instead of one
+            sim = self.sim
+            try:
+                for _ in range(RUN_BATCH):
+                    if sim.state.halted:
+                        break
+                    sim.fetch()
+                    sim.decode_execute()
+            except Exception as e:
+                self._update_displays()
+                messagebox.showerror("Simulator Error", str(e))
+                return
+            self._update_displays()
+            if not sim.state.halted:
+                self.master.after(1, run_step)
 
         run_step()
 
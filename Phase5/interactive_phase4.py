@@ -1,8 +1,15 @@
 import tkinter as tk
 from tkinter import scrolledtext, ttk
 import sys
-import threading
+import os
 import time
+import argparse
+from types import SimpleNamespace
+import bisect
+import collections
+import contextlib
+import itertools
+from functools import lru_cache
 
 # Import from phase5.py
 try:
@@ -12,6 +19,29 @@ except ImportError as e:
     print("Make sure 'phase5.py' is in the same directory and has the required classes/functions.")
     sys.exit()
 
+LOG_DISPLAY_LINES = 500  # Oldest log lines are trimmed from the widget past this count
+LOG_HISTORY = 10_000  # Simulator log entries kept in memory
+
+# Cycle pacing, overridable via PHASE4_CYCLE_MS / PHASE4_MAX_CYCLES for benchmarking;
+# a cycle delay of 0 runs at full speed and only redraws when the simulation ends
+DEFAULT_CYCLE_MS = 500
+DEFAULT_MAX_CYCLES = 100  # Prevent infinite loops
+
+# Label text for the boolean indicators, so renders look strings up instead of formatting them
+STALL_TEXT = {True: "Stall: Yes", False: "Stall: No"}
+FLUSH_TEXT = {True: "Flush: Yes", False: "Flush: No"}
+FLAG_TEXT = {name: {True: f"{name}: True", False: f"{name}: False"} for name in "ZNC"}
+
+# Instruction words are small ints, so formatted pipeline slots cache well
+format_instruction = lru_cache(maxsize=1024)(format_instruction)
+
+EXAMPLE_PROGRAM = [
+    make_instruction(0b1101, rd=1, address_or_operand=3),  # MOV R1, #3
+    make_instruction(0b1101, rd=2, address_or_operand=5),  # MOV R2, #5
+    make_instruction(0b1000, rd=0, rs=1, rt=2),           # ADD R0, R1, R2
+    make_instruction(0b0011)                               # HALT
+]
+
 
 class InteractivePhase4SimulatorGUI:
     def __init__(self, master):
@@ -22,31 +52,58 @@ class InteractivePhase4SimulatorGUI:
         self.simulator = Phase4Simulator()
         
         # Example program for loading
-        self.example_program = [
-            make_instruction(0b1101, rd=1, address_or_operand=3),  # MOV R1, #3
-            make_instruction(0b1101, rd=2, address_or_operand=5),  # MOV R2, #5
-            make_instruction(0b1000, rd=0, rs=1, rt=2),           # ADD R0, R1, R2
-            make_instruction(0b0011)                               # HALT
-        ]
+        self.example_program = list(EXAMPLE_PROGRAM)
         
-        # Thread management
-        self.simulator_thread = None
+        # Simulation scheduling: cycles run on the Tk event loop via after()
         self.running = False
-        self.pause_event = threading.Event()
-        self.stop_event = threading.Event()
+        self.paused = False
+        self._after_id = None
+        self._cycle_count = 0
+        self._cycle_ms = int(os.environ.get("PHASE4_CYCLE_MS", DEFAULT_CYCLE_MS))
+        self._max_cycles = int(os.environ.get("PHASE4_MAX_CYCLES", DEFAULT_MAX_CYCLES))
         
         # UI components
-        self.pipeline_vars = {}
         self.register_display = None
         self.memory_display = None
         self.log_display = None
         self.status_bar = None
         
+        # Last value set on each pipeline StringVar, keyed by id() of the variable
+        self._pipeline_shadow = {}
+        
+        # Raw status values behind the labels as of the last render
+        self._prev = SimpleNamespace(pc=None, stall=None, flush=None, z=None, n=None, c=None)
+        
+        # Memory as of the last render, its sorted addresses, and the rows shown
+        self._mem_shadow = {}
+        self._mem_keys = []
+        self._mem_lines = []
+        
+        # Lines currently in the log widget
+        self._log_lines_shown = 0
+        
+        # One format template per row of four registers, and the last-rendered row strings
+        num_registers = len(self.simulator.state.registers)
+        self._reg_row_templates = [
+            "  ".join(f"R{j}: 0x{{:08x}}" for j in range(i, min(i + 4, num_registers)))
+            for i in range(0, num_registers, 4)
+        ]
+        self._reg_cache = [None] * len(self._reg_row_templates)
+        
+        # Raw simulator state as of the last snapshot, used to send only changes
+        self._last_snap = {}
+        
+        # Render scheduling: redraws are deferred to Tk's idle time unless the UI has been idle
+        self._render_pending = False
+        self._last_render_ts = 0.0
+        self._batch_depth = 0
+        
         self._create_widgets()
         
         # Load example program
         self.simulator.load_program(self.example_program)
         # Add initialization log entry
+        self.simulator.log = collections.deque(self.simulator.log, maxlen=LOG_HISTORY)
         self.simulator.log.append("Program loaded. Click 'Step' or 'Run' to start execution.")
         
         # Initial UI update
@@ -100,61 +157,47 @@ class InteractivePhase4SimulatorGUI:
         ttk.Label(stages_frame, text="Decode:").grid(row=1, column=0, sticky=tk.W, padx=5)
         ttk.Label(stages_frame, text="Execute:").grid(row=2, column=0, sticky=tk.W, padx=5)
         
-        fetch_var = tk.StringVar(value="-")
-        decode_var = tk.StringVar(value="-")
-        execute_var = tk.StringVar(value="-")
+        self._fetch_var = tk.StringVar(value="-")
+        self._decode_var = tk.StringVar(value="-")
+        self._execute_var = tk.StringVar(value="-")
         
-        ttk.Label(stages_frame, textvariable=fetch_var).grid(row=0, column=1, sticky=tk.W, padx=5)
-        ttk.Label(stages_frame, textvariable=decode_var).grid(row=1, column=1, sticky=tk.W, padx=5)
-        ttk.Label(stages_frame, textvariable=execute_var).grid(row=2, column=1, sticky=tk.W, padx=5)
+        ttk.Label(stages_frame, textvariable=self._fetch_var).grid(row=0, column=1, sticky=tk.W, padx=5)
+        ttk.Label(stages_frame, textvariable=self._decode_var).grid(row=1, column=1, sticky=tk.W, padx=5)
+        ttk.Label(stages_frame, textvariable=self._execute_var).grid(row=2, column=1, sticky=tk.W, padx=5)
         
         # Status indicators
         status_frame = ttk.Frame(pipeline_frame)
         status_frame.pack(fill=tk.X, padx=5, pady=5)
         
-        pc_var = tk.StringVar(value="PC: 0x0000")
-        stall_var = tk.StringVar(value="Stall: No")
-        flush_var = tk.StringVar(value="Flush: No")
-        
-        ttk.Label(status_frame, textvariable=pc_var).pack(side=tk.LEFT, padx=5)
-        ttk.Label(status_frame, textvariable=stall_var).pack(side=tk.LEFT, padx=5)
-        ttk.Label(status_frame, textvariable=flush_var).pack(side=tk.LEFT, padx=5)
+        self._pc_var = tk.StringVar(value="PC: 0x0000")
+        self._stall_var = tk.StringVar(value="Stall: No")
+        self._flush_var = tk.StringVar(value="Flush: No")
         
-        # Save pipeline variables for updating
-        self.pipeline_vars = {
-            'fetch': fetch_var,
-            'decode': decode_var,
-            'execute': execute_var,
-            'pc': pc_var,
-            'stall': stall_var,
-            'flush': flush_var
-        }
+        ttk.Label(status_frame, textvariable=self._pc_var).pack(side=tk.LEFT, padx=5)
+        ttk.Label(status_frame, textvariable=self._stall_var).pack(side=tk.LEFT, padx=5)
+        ttk.Label(status_frame, textvariable=self._flush_var).pack(side=tk.LEFT, padx=5)
         
         # Flags frame
         flags_frame = ttk.Frame(pipeline_frame)
         flags_frame.pack(fill=tk.X, padx=5, pady=5)
         
-        z_flag_var = tk.StringVar(value="Z: False")
-        n_flag_var = tk.StringVar(value="N: False")
-        c_flag_var = tk.StringVar(value="C: False")
+        self._z_flag_var = tk.StringVar(value="Z: False")
+        self._n_flag_var = tk.StringVar(value="N: False")
+        self._c_flag_var = tk.StringVar(value="C: False")
         
-        ttk.Label(flags_frame, textvariable=z_flag_var).pack(side=tk.LEFT, padx=5)
-        ttk.Label(flags_frame, textvariable=n_flag_var).pack(side=tk.LEFT, padx=5)
-        ttk.Label(flags_frame, textvariable=c_flag_var).pack(side=tk.LEFT, padx=5)
-        
-        self.pipeline_vars.update({
-            'z_flag': z_flag_var,
-            'n_flag': n_flag_var,
-            'c_flag': c_flag_var
-        })
+        ttk.Label(flags_frame, textvariable=self._z_flag_var).pack(side=tk.LEFT, padx=5)
+        ttk.Label(flags_frame, textvariable=self._n_flag_var).pack(side=tk.LEFT, padx=5)
+        ttk.Label(flags_frame, textvariable=self._c_flag_var).pack(side=tk.LEFT, padx=5)
         
         # Register frame
         register_frame = ttk.LabelFrame(left_frame, text="Registers")
         register_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
         # Register display with scrolling
-        self.register_display = scrolledtext.ScrolledText(register_frame, height=10)
-        self.register_display.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.register_display = self._create_dump_text(register_frame, height=10)
+        
+        # One empty line per row of four registers, overwritten in place on update
+        self.register_display.insert(tk.END, "\n" * len(self._reg_row_templates))
         
         # Right side: Memory & Log panel (40% width)
         right_frame = ttk.Frame(content_frame)
@@ -164,8 +207,7 @@ class InteractivePhase4SimulatorGUI:
         memory_frame = ttk.LabelFrame(right_frame, text="Memory")
         memory_frame.pack(fill=tk.BOTH, expand=True)
         
-        self.memory_display = scrolledtext.ScrolledText(memory_frame, width=30, height=10)
-        self.memory_display.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.memory_display = self._create_dump_text(memory_frame, width=30, height=10)
         
         # Log display
         log_frame = ttk.LabelFrame(right_frame, text="Execution Log")
@@ -178,69 +220,222 @@ class InteractivePhase4SimulatorGUI:
         self.status_bar = ttk.Label(main_frame, text="Ready", relief=tk.SUNKEN, anchor=tk.W)
         self.status_bar.pack(fill=tk.X, side=tk.BOTTOM, pady=(10, 0))
 
-    def _update_pipeline_display(self):
+    def _create_dump_text(self, parent, **kwargs):
+        # Fixed-width dumps don't need wrapping or undo history, which ScrolledText keeps
+        # growing with every insert
+        frame = ttk.Frame(parent)
+        frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        text = tk.Text(frame, wrap=tk.NONE, undo=False, autoseparators=False,
+                       blockcursor=False, **kwargs)
+        scrollbar = ttk.Scrollbar(frame, orient=tk.VERTICAL, command=text.yview)
+        text.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        return text
+
+    def _snapshot(self):
+        # Collect only the fields that changed since the previous snapshot, copying
+        # mutable state so rendering never reads live simulator objects
+        sim = self.simulator
+        last = self._last_snap
+        delta = {}
+        
+        pipeline = (sim.pipeline['F'], sim.pipeline['D'], sim.pipeline['E'])
+        if pipeline != last.get('pipeline'):
+            last['pipeline'] = pipeline
+            delta['pipeline'] = tuple(format_instruction(instr) for instr in pipeline)
+        for key, value in (('pc', sim.state.pc),
+                           ('stall', sim.stall_detected),
+                           ('flush', sim.flush_detected)):
+            if key not in last or last[key] != value:
+                last[key] = delta[key] = value
+        flags = sim.state.flags.as_dict()
+        if flags != last.get('flags'):
+            last['flags'] = delta['flags'] = flags
+        if sim.state.registers != last.get('registers'):
+            last['registers'] = delta['registers'] = list(sim.state.registers)
+        if sim.state.memory != last.get('memory'):
+            last['memory'] = delta['memory'] = dict(sim.state.memory)
+        # The log is bounded, so its length stops growing once full; new entries are
+        # found by looking back from the end for the last entry already sent instead.
+        # Anything older than the widget's line cap would be trimmed straight away.
+        log = sim.log
+        log_tail = log[-1] if log else None
+        prev_tail = last.get('log_tail')
+        if log_tail is not prev_tail:
+            recent = []
+            for entry in itertools.islice(reversed(log), LOG_DISPLAY_LINES):
+                if entry is prev_tail:
+                    break
+                recent.append(entry)
+            recent.reverse()
+            last['log_tail'] = log_tail
+            delta['log'] = recent
+        return delta
+
+    def _update_pipeline_display(self, snapshot):
         # Update pipeline status
-        self.pipeline_vars['fetch'].set(f"{format_instruction(self.simulator.pipeline['F'])}")
-        self.pipeline_vars['decode'].set(f"{format_instruction(self.simulator.pipeline['D'])}")
-        self.pipeline_vars['execute'].set(f"{format_instruction(self.simulator.pipeline['E'])}")
-        
-        # Update status indicators
-        self.pipeline_vars['pc'].set(f"PC: 0x{self.simulator.state.pc:04x}")
-        self.pipeline_vars['stall'].set(f"Stall: {'Yes' if self.simulator.stall_detected else 'No'}")
-        self.pipeline_vars['flush'].set(f"Flush: {'Yes' if self.simulator.flush_detected else 'No'}")
+        if 'pipeline' in snapshot:
+            fetch, decode, execute = snapshot['pipeline']
+            self._set_var(self._fetch_var, fetch)
+            self._set_var(self._decode_var, decode)
+            self._set_var(self._execute_var, execute)
+        
+        # Update status indicators, comparing raw values before building any text
+        prev = self._prev
+        if 'pc' in snapshot and snapshot['pc'] != prev.pc:
+            prev.pc = snapshot['pc']
+            self._set_var(self._pc_var, f"PC: 0x{prev.pc:04x}")
+        if 'stall' in snapshot and snapshot['stall'] != prev.stall:
+            prev.stall = snapshot['stall']
+            self._set_var(self._stall_var, STALL_TEXT[bool(prev.stall)])
+        if 'flush' in snapshot and snapshot['flush'] != prev.flush:
+            prev.flush = snapshot['flush']
+            self._set_var(self._flush_var, FLUSH_TEXT[bool(prev.flush)])
         
         # Update flags
-        self.pipeline_vars['z_flag'].set(f"Z: {self.simulator.state.flags['Z']}")
-        self.pipeline_vars['n_flag'].set(f"N: {self.simulator.state.flags['N']}")
-        self.pipeline_vars['c_flag'].set(f"C: {self.simulator.state.flags['C']}")
-
-    def _update_register_display(self):
-        reg_text = ""
-        for i in range(0, len(self.simulator.state.registers), 4):
-            reg_line = "  ".join([f"R{i+j}: 0x{self.simulator.state.registers[i+j]:08x}" 
-                                for j in range(4) if i+j < len(self.simulator.state.registers)])
-            reg_text += reg_line + "\n"
-        
-        self.register_display.delete(1.0, tk.END)
-        self.register_display.insert(tk.END, reg_text)
-
-    def _update_memory_display(self):
-        memory_content = ""
+        if 'flags' in snapshot:
+            flags = snapshot['flags']
+            if flags['Z'] != prev.z:
+                prev.z = flags['Z']
+                self._set_var(self._z_flag_var, FLAG_TEXT['Z'][prev.z])
+            if flags['N'] != prev.n:
+                prev.n = flags['N']
+                self._set_var(self._n_flag_var, FLAG_TEXT['N'][prev.n])
+            if flags['C'] != prev.c:
+                prev.c = flags['C']
+                self._set_var(self._c_flag_var, FLAG_TEXT['C'][prev.c])
+
+    def _set_var(self, var, value):
+        # Each StringVar.set crosses into Tcl and redraws the label, so skip no-op updates
+        key = id(var)
+        if self._pipeline_shadow.get(key) != value:
+            var.set(value)
+            self._pipeline_shadow[key] = value
+
+    def _update_register_display(self, snapshot):
+        if 'registers' not in snapshot:
+            return
+        registers = snapshot['registers']
+        for row, template in enumerate(self._reg_row_templates):
+            row_str = template.format(*registers[row * 4:row * 4 + 4])
+            
+            # Only rewrite the rows whose registers changed
+            if row_str != self._reg_cache[row]:
+                self._reg_cache[row] = row_str
+                line = row + 1
+                self.register_display.replace(f"{line}.0", f"{line}.end", row_str)
+
+    def _update_memory_display(self, snapshot):
+        if 'memory' not in snapshot:
+            return
+        memory = snapshot['memory']
+        
+        # Diff against the last snapshot; a full rebuild is only needed if addresses disappeared
+        changed = memory.items() - self._mem_shadow.items()
+        if not changed and len(memory) == len(self._mem_shadow):
+            return
+        new_addrs = [addr for addr, _ in changed if addr not in self._mem_shadow]
+        if len(memory) < len(self._mem_shadow) + len(new_addrs):
+            self._mem_keys = sorted(memory)
+        else:
+            for addr in new_addrs:
+                bisect.insort(self._mem_keys, addr)
+        self._mem_shadow = memory
+        
+        lines = []
         # Display first 20 memory locations that are non-zero
         count = 0
-        for addr in sorted(self.simulator.state.memory.keys()):
-            value = self.simulator.state.memory[addr]
+        for addr in self._mem_keys:
+            value = memory[addr]
             if value != 0 or count < 10:  # Show at least 10 entries
-                memory_content += f"0x{addr:04x}: 0x{value:08x}\n"
+                lines.append(f"0x{addr:04x}: 0x{value:08x}")
                 count += 1
             if count >= 20:
                 break
-                
-        self.memory_display.delete(1.0, tk.END)
-        self.memory_display.insert(tk.END, memory_content)
+        
+        # Rewrite only the rows that changed, then append or trim the tail
+        for i, text in enumerate(lines):
+            line = i + 1
+            if i >= len(self._mem_lines):
+                self.memory_display.insert(f"{line}.0", text + "\n")
+            elif text != self._mem_lines[i]:
+                self.memory_display.replace(f"{line}.0", f"{line}.end", text)
+        if len(lines) < len(self._mem_lines):
+            self.memory_display.delete(f"{len(lines) + 1}.0", tk.END)
+        self._mem_lines = lines
 
-    def _update_log_display(self):
-        # Get the last 20 log entries
-        log_entries = self.simulator.log[-20:] if self.simulator.log else []
-        log_content = "\n".join(log_entries)
+    def _update_log_display(self, snapshot):
+        # The log is append-only, so only entries added since the last render are inserted
+        if 'log' not in snapshot:
+            return
+        new_entries = snapshot['log']
+        log_content = "\n".join(new_entries)
+        if self._log_lines_shown:
+            log_content = "\n" + log_content
         
-        self.log_display.delete(1.0, tk.END)
         self.log_display.insert(tk.END, log_content)
+        self._log_lines_shown += len(new_entries)
+        
+        # Trim the oldest lines once the widget grows past the cap
+        excess = self._log_lines_shown - LOG_DISPLAY_LINES
+        if excess > 0:
+            self.log_display.delete("1.0", f"{excess + 1}.0")
+            self._log_lines_shown -= excess
         self.log_display.see(tk.END)  # Scroll to see the latest logs
 
-    def _update_all_displays(self):
-        self._update_pipeline_display()
-        self._update_register_display()
-        self._update_memory_display()
-        self._update_log_display()
+    def _invalidate_render_caches(self):
+        # Called after the simulator is reset. The register, memory and label caches mirror
+        # what the widgets show, so they stay valid; the log restarts and the next snapshot
+        # must carry the full simulator state.
+        self.log_display.delete(1.0, tk.END)
+        self._log_lines_shown = 0
+        self._last_snap = {}
+
+    def _update_all_displays(self, snapshot=None):
+        if snapshot is None:
+            snapshot = self._snapshot()
+        with self._batched_ui():
+            self._update_pipeline_display(snapshot)
+            self._update_register_display(snapshot)
+            self._update_memory_display(snapshot)
+            self._update_log_display(snapshot)
+        self._last_render_ts = time.monotonic()
+
+    @contextlib.contextmanager
+    def _batched_ui(self):
+        # Make all widget mutations first, then run a single geometry/redraw pass on the
+        # outermost exit; nested uses just join the enclosing batch
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.master.tk.call('update', 'idletasks')
+
+    def _flush_render(self):
+        # Runs once Tk has drained pending events, so a burst of requests renders once
+        if self._render_pending:
+            self._render_pending = False
+            self._update_all_displays()
+
+    def _request_render(self):
+        # Render immediately if nothing has been drawn recently, otherwise defer to idle time
+        if time.monotonic() - self._last_render_ts > 0.033:
+            self._render_pending = False
+            self._update_all_displays()
+        elif not self._render_pending:
+            self._render_pending = True
+            self.master.after_idle(self._flush_render)
 
     def _load_program(self, example_num):
         # Stop any running simulation
         if self.running:
             self._stop_simulation()
         
-        # Reset simulator
-        self.simulator = Phase4Simulator()
+        # Reset simulator in place
+        self.simulator.reset()
         
         if example_num == 1:
             # Basic program
@@ -280,126 +475,152 @@ class InteractivePhase4SimulatorGUI:
         self.simulator.load_program(program)
         
         # Add informative log entries
-        self.simulator.log = []  # Clear previous logs
         self.simulator.log.append(f"Program loaded: Example {example_num}")
         self.simulator.log.append(description)
         self.simulator.log.append("Click 'Step' or 'Run' to start execution")
+        self._invalidate_render_caches()
         
         # Initialize the pipeline with the first instruction
         self.simulator.fetch()  # This fills the F stage with the first instruction
         
-        self._update_all_displays()
+        self._request_render()
 
     def _run_simulation(self):
-        if self.running:
+        if self.running and not self.paused:
             return
             
-        self.running = True
-        self.pause_event.clear()
-        self.stop_event.clear()
-        
-        # Start the simulation thread
-        self.simulator_thread = threading.Thread(target=self._run_simulation_thread)
-        self.simulator_thread.daemon = True
-        self.simulator_thread.start()
+        if not self.running:
+            self.running = True
+            self._cycle_count = 0
+        self.paused = False
+        self._schedule_cycle()
         
         self.status_bar.config(text="Running simulation...")
 
-    def _run_simulation_thread(self):
-        cycle_count = 0
-        max_cycles = 100  # Prevent infinite loops
-        
-        while not self.stop_event.is_set() and cycle_count < max_cycles:
-            if self.pause_event.is_set():
-                time.sleep(0.1)
-                continue
-                
-            # Check if simulation is complete
-            if (self.simulator.pipeline['F'] is None and 
-                self.simulator.pipeline['D'] is None and 
-                self.simulator.pipeline['E'] is None):
-                break
-                
-            # Run one cycle
-            self.simulator.pipeline_step()
-            cycle_count += 1
-            
-            # Update UI
-            self.master.after(0, self._update_all_displays)
+    def _schedule_cycle(self):
+        self._after_id = self.master.after(self._cycle_ms, self._cycle_once)
+
+    def _cycle_once(self):
+        self._after_id = None
+        if self._advance_cycle():
+            # At full speed the free-running loop skips per-cycle redraws
+            if self._cycle_ms:
+                self._request_render()
+            self._schedule_cycle()
+
+    def _advance_cycle(self):
+        # Run one cycle; returns False once the simulation has finished
+        if self._cycle_count >= self._max_cycles:
+            self._finish_simulation("Simulation stopped (max cycles reached)")
+            return False
             
-            # Slow down simulation for visualization
-            time.sleep(0.5)
+        # Check if simulation is complete
+        if self.simulator.is_idle:
+            self._finish_simulation("Simulation complete")
+            return False
             
-        # Simulation complete
+        self.simulator.pipeline_step()
+        self._cycle_count += 1
+        return True
+
+    def _finish_simulation(self, status):
         self.running = False
-        if cycle_count >= max_cycles:
-            self.master.after(0, lambda: self.status_bar.config(text="Simulation stopped (max cycles reached)"))
-        else:
-            self.master.after(0, lambda: self.status_bar.config(text="Simulation complete"))
+        self.paused = False
+        self.status_bar.config(text=status)
+        self._request_render()
 
     def _pause_simulation(self):
-        if not self.running:
+        if not self.running or self.paused:
             return
             
-        self.pause_event.set()
+        self.paused = True
+        if self._after_id is not None:
+            self.master.after_cancel(self._after_id)
+            self._after_id = None
         self.status_bar.config(text="Simulation paused")
+        self._request_render()
 
     def _step_simulation(self):
         # If not running, we can do a single step
         if not self.running:
-            if (self.simulator.pipeline['F'] is None and 
-                self.simulator.pipeline['D'] is None and 
-                self.simulator.pipeline['E'] is None):
+            if self.simulator.is_idle:
                 self.status_bar.config(text="Simulation complete - no more steps")
                 return
                 
             self.simulator.pipeline_step()
-            self._update_all_displays()
+            self._request_render()
             
         # If running but paused, do a single step
-        elif self.pause_event.is_set():
-            self.pause_event.clear()
-            time.sleep(0.1)  # Allow simulation to take one step
-            self.pause_event.set()
-            self._update_all_displays()
+        elif self.paused:
+            if self._advance_cycle():
+                self._request_render()
 
     def _stop_simulation(self):
         if not self.running:
             return
             
-        self.stop_event.set()
-        self.pause_event.clear()
-        
-        # Wait for thread to finish
-        if self.simulator_thread:
-            self.simulator_thread.join(timeout=1.0)
+        if self._after_id is not None:
+            self.master.after_cancel(self._after_id)
+            self._after_id = None
             
         self.running = False
+        self.paused = False
         self.status_bar.config(text="Simulation stopped")
-        self._update_all_displays()
+        self._request_render()
 
     def _reset_simulation(self):
         # Stop any running simulation
         if self.running:
             self._stop_simulation()
             
-        # Create new simulator
-        self.simulator = Phase4Simulator()
+        # Reset simulator in place
+        self.simulator.reset()
         
         # Load example program
         self.simulator.load_program(self.example_program)
         
         # Add informative log entry
-        self.simulator.log = ["Simulator reset. Click 'Step' or 'Run' to start execution."]
+        self.simulator.log.append("Simulator reset. Click 'Step' or 'Run' to start execution.")
+        self._invalidate_render_caches()
         
         # Initialize the pipeline with the first instruction
         self.simulator.fetch()  # This fills the F stage with the first instruction
                 
-        self._update_all_displays()
+        self._request_render()
         self.status_bar.config(text="Simulation reset")
 
 
+def run_headless(repeat=1000):
+    """Run the example program to completion without a GUI and report simulator throughput"""
+    simulator = Phase4Simulator()
+    simulator.log_enabled = False
+    max_cycles = int(os.environ.get("PHASE4_MAX_CYCLES", DEFAULT_MAX_CYCLES))
+    cycles = 0
+    start = time.perf_counter()
+    for _ in range(repeat):
+        simulator.reset()
+        simulator.load_program(EXAMPLE_PROGRAM)
+        simulator.fetch()
+        for _ in range(max_cycles):
+            if simulator.is_idle:
+                break
+            simulator.pipeline_step()
+            cycles += 1
+    elapsed = time.perf_counter() - start
+    print(f"{cycles} cycles in {elapsed:.3f}s ({cycles / elapsed:.0f} cycles/sec)")
+
+
 def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--headless', action='store_true',
+                        help='Run the example program without the GUI and print cycles/sec')
+    parser.add_argument('--repeat', type=int, default=1000,
+                        help='Number of headless runs of the example program')
+    args = parser.parse_args()
+    if args.headless:
+        run_headless(args.repeat)
+        return
+    
     root = tk.Tk()
     root.geometry("1000x700")
     root.title("Interactive Phase 4 Pipelined Simulator")
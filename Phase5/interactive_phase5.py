@@ -1,8 +1,12 @@
 import tkinter as tk
 from tkinter import scrolledtext, ttk
 import sys
-import threading
+import os
 import time
+import math
+import collections
+import itertools
+from functools import lru_cache
 
 # Import from phase5.py
 try:
@@ -12,6 +16,31 @@ except ImportError as e:
     print("Make sure 'phase5.py' is in the same directory and has the required classes/functions.")
     sys.exit()
 
+# Cycle pacing, overridable via PHASE5_CYCLE_MS; 0 runs the cores at full speed
+DEFAULT_CYCLE_MS = 200
+MAX_CYCLES_PER_SEC = 10000  # Top of the speed slider, which runs on a log10 axis from 1 cycle/s
+UI_TICK_MS = 33  # Redraws are coalesced to at most one per tick (~30 Hz)
+LOG_DISPLAY_LINES = 200  # Oldest log lines are trimmed from the widget past this count
+LOG_HISTORY = 1000  # Log entries kept in the shared buffer between renders
+
+# Instruction words are small ints shared by every thread's program, so formatted slots cache well
+format_instruction = lru_cache(maxsize=4096)(format_instruction)
+
+
+class _LogTap:
+    """Stands in for a thread's log list, tagging its entries into a shared buffer"""
+
+    __slots__ = ("buffer", "prefix")
+
+    def __init__(self, buffer, core_id, thread_id):
+        self.buffer = buffer
+        self.prefix = f"[Core {core_id}.{thread_id}]"
+
+    def append(self, entry):
+        if not entry.startswith("[Core "):
+            entry = self.prefix + entry
+        self.buffer.append(entry)
+
 
 class InteractivePhase5SimulatorGUI:
     def __init__(self, master):
@@ -24,11 +53,18 @@ class InteractivePhase5SimulatorGUI:
         # Create cores
         self.cores = [Core(i, self.memory_controller) for i in range(NUM_CORES)]
         
-        # Thread management
-        self.core_threads = []
+        # Simulation scheduling: every core is cycled in turn on the Tk event loop via after()
         self.running = False
-        self.pause_event = threading.Event()
-        self.stop_event = threading.Event()
+        self.paused = False
+        self._after_id = None
+        self._active_cores = []
+        self._cycle_ms = int(os.environ.get("PHASE5_CYCLE_MS", DEFAULT_CYCLE_MS))
+        self._cycles_per_tick = 1
+        self._speed = 1000 / self._cycle_ms if self._cycle_ms else None  # cycles/s; None runs flat out
+        
+        # Render scheduling: redraws are deferred to Tk's idle time unless the UI has been idle
+        self._render_pending = False
+        self._last_render_ts = 0.0
         
         # Example program for loading
         self.example_program = [
@@ -44,6 +80,29 @@ class InteractivePhase5SimulatorGUI:
         self.memory_display = None
         self.status_bar = None
         
+        # Per-thread state as of the last render, keyed by (core_id, thread_id), and the
+        # last value set on each StringVar, keyed by id() of the variable
+        self._thread_snapshots = {}
+        self._var_shadow = {}
+        
+        # One %-format template per line of four registers
+        num_registers = len(self.cores[0].threads[0].state.registers)
+        self._reg_row_fmts = [
+            "  ".join(f"R{j}: 0x%08x" for j in range(i, min(i + 4, num_registers)))
+            for i in range(0, num_registers, 4)
+        ]
+        
+        # Memory words and pane rows as last rendered
+        self._mem_words = None
+        self._mem_lines = []
+        
+        # Every thread logs into one bounded buffer, in execution order; the log pane
+        # appends whatever arrived after the last entry it showed
+        self._log_buffer = collections.deque(maxlen=LOG_HISTORY)
+        self._log_tail = None
+        self._log_lines_shown = 0
+        self._attach_logs()
+        
         self._create_widgets()
         
         # Load example program on all cores
@@ -70,6 +129,16 @@ class InteractivePhase5SimulatorGUI:
         ttk.Button(control_frame, text="Stop", command=self._stop_simulation).pack(side=tk.LEFT, padx=5)
         ttk.Button(control_frame, text="Reset", command=self._reset_simulation).pack(side=tk.LEFT, padx=5)
         
+        # Speed control, in cycles per second
+        speed = self._speed or MAX_CYCLES_PER_SEC
+        self.speed_var = tk.DoubleVar(value=math.log10(min(max(speed, 1), MAX_CYCLES_PER_SEC)))
+        self.speed_label_var = tk.StringVar()
+        ttk.Label(control_frame, text="Speed:").pack(side=tk.LEFT, padx=(15, 5))
+        ttk.Scale(control_frame, from_=0, to=math.log10(MAX_CYCLES_PER_SEC), variable=self.speed_var,
+                  command=self._on_speed_change).pack(side=tk.LEFT, padx=5)
+        ttk.Label(control_frame, textvariable=self.speed_label_var, width=14).pack(side=tk.LEFT, padx=5)
+        self._show_speed()
+        
         # Main content area with splitters
         content_frame = ttk.Frame(main_frame)
         content_frame.pack(fill=tk.BOTH, expand=True)
@@ -82,74 +151,17 @@ class InteractivePhase5SimulatorGUI:
         self.core_tabs = ttk.Notebook(left_frame)
         self.core_tabs.pack(fill=tk.BOTH, expand=True)
         
-        # Create tabs for each core
+        # Create tabs for each core; their thread panes are built on first view
         self.thread_frames = {}
+        self._core_frames = []
+        self._built_cores = set()
         for core_id in range(NUM_CORES):
             core_frame = ttk.Frame(self.core_tabs)
             self.core_tabs.add(core_frame, text=f"Core {core_id}")
-            
-            # Create thread tabs inside core tab
-            thread_notebook = ttk.Notebook(core_frame)
-            thread_notebook.pack(fill=tk.BOTH, expand=True)
-            
-            for thread_id in range(NUM_THREADS_PER_CORE):
-                thread_frame = ttk.Frame(thread_notebook)
-                thread_notebook.add(thread_frame, text=f"Thread {thread_id}")
-                
-                # Pipeline status
-                pipeline_frame = ttk.LabelFrame(thread_frame, text="Pipeline Status")
-                pipeline_frame.pack(fill=tk.X, padx=5, pady=5)
-                
-                # Pipeline stages
-                stages_frame = ttk.Frame(pipeline_frame)
-                stages_frame.pack(fill=tk.X, padx=5, pady=5)
-                
-                ttk.Label(stages_frame, text="Fetch:").grid(row=0, column=0, sticky=tk.W, padx=5)
-                ttk.Label(stages_frame, text="Decode:").grid(row=1, column=0, sticky=tk.W, padx=5)
-                ttk.Label(stages_frame, text="Execute:").grid(row=2, column=0, sticky=tk.W, padx=5)
-                
-                fetch_var = tk.StringVar(value="-")
-                decode_var = tk.StringVar(value="-")
-                execute_var = tk.StringVar(value="-")
-                
-                ttk.Label(stages_frame, textvariable=fetch_var).grid(row=0, column=1, sticky=tk.W, padx=5)
-                ttk.Label(stages_frame, textvariable=decode_var).grid(row=1, column=1, sticky=tk.W, padx=5)
-                ttk.Label(stages_frame, textvariable=execute_var).grid(row=2, column=1, sticky=tk.W, padx=5)
-                
-                # Status indicators
-                status_frame = ttk.Frame(pipeline_frame)
-                status_frame.pack(fill=tk.X, padx=5, pady=5)
-                
-                pc_var = tk.StringVar(value="PC: 0x0000")
-                stall_var = tk.StringVar(value="Stall: No")
-                flush_var = tk.StringVar(value="Flush: No")
-                
-                ttk.Label(status_frame, textvariable=pc_var).pack(side=tk.LEFT, padx=5)
-                ttk.Label(status_frame, textvariable=stall_var).pack(side=tk.LEFT, padx=5)
-                ttk.Label(status_frame, textvariable=flush_var).pack(side=tk.LEFT, padx=5)
-                
-                # Register frame
-                register_frame = ttk.LabelFrame(thread_frame, text="Registers")
-                register_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-                
-                # Create register display with scrolling
-                register_scroll = ttk.Frame(register_frame)
-                register_scroll.pack(fill=tk.BOTH, expand=True)
-                
-                reg_display = scrolledtext.ScrolledText(register_scroll, height=10)
-                reg_display.pack(fill=tk.BOTH, expand=True)
-                
-                # Create a dict to hold all variables for this thread
-                self.thread_frames[(core_id, thread_id)] = {
-                    'fetch': fetch_var,
-                    'decode': decode_var,
-                    'execute': execute_var,
-                    'pc': pc_var,
-                    'stall': stall_var,
-                    'flush': flush_var,
-                    'registers': reg_display
-                }
-                
+            self._core_frames.append(core_frame)
+        self.core_tabs.bind("<<NotebookTabChanged>>", self._on_core_tab_changed)
+        self._build_thread_widgets(0)
+        
         # Right side: Memory & Log panel (30% width)
         right_frame = ttk.Frame(content_frame)
         right_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=False, padx=(10, 0))
@@ -158,8 +170,7 @@ class InteractivePhase5SimulatorGUI:
         memory_frame = ttk.LabelFrame(right_frame, text="Memory")
         memory_frame.pack(fill=tk.BOTH, expand=True)
         
-        self.memory_display = scrolledtext.ScrolledText(memory_frame, width=30, height=10)
-        self.memory_display.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.memory_display = self._create_dump_text(memory_frame, width=30, height=10)
         
         # Log display
         log_frame = ttk.LabelFrame(right_frame, text="Execution Log")
@@ -172,127 +183,274 @@ class InteractivePhase5SimulatorGUI:
         self.status_bar = ttk.Label(main_frame, text="Ready", relief=tk.SUNKEN, anchor=tk.W)
         self.status_bar.pack(fill=tk.X, side=tk.BOTTOM, pady=(10, 0))
 
+    def _build_thread_widgets(self, core_id):
+        # Thread panes are only built once their core tab is first shown
+        core_frame = self._core_frames[core_id]
+        self._built_cores.add(core_id)
+        
+        # Create thread tabs inside core tab
+        thread_notebook = ttk.Notebook(core_frame)
+        thread_notebook.pack(fill=tk.BOTH, expand=True)
+        
+        for thread_id in range(NUM_THREADS_PER_CORE):
+            thread_frame = ttk.Frame(thread_notebook)
+            thread_notebook.add(thread_frame, text=f"Thread {thread_id}")
+            
+            # Pipeline status
+            pipeline_frame = ttk.LabelFrame(thread_frame, text="Pipeline Status")
+            pipeline_frame.pack(fill=tk.X, padx=5, pady=5)
+            
+            # Pipeline stages
+            stages_frame = ttk.Frame(pipeline_frame)
+            stages_frame.pack(fill=tk.X, padx=5, pady=5)
+            
+            ttk.Label(stages_frame, text="Fetch:").grid(row=0, column=0, sticky=tk.W, padx=5)
+            ttk.Label(stages_frame, text="Decode:").grid(row=1, column=0, sticky=tk.W, padx=5)
+            ttk.Label(stages_frame, text="Execute:").grid(row=2, column=0, sticky=tk.W, padx=5)
+            
+            fetch_var = tk.StringVar(value="-")
+            decode_var = tk.StringVar(value="-")
+            execute_var = tk.StringVar(value="-")
+            
+            ttk.Label(stages_frame, textvariable=fetch_var).grid(row=0, column=1, sticky=tk.W, padx=5)
+            ttk.Label(stages_frame, textvariable=decode_var).grid(row=1, column=1, sticky=tk.W, padx=5)
+            ttk.Label(stages_frame, textvariable=execute_var).grid(row=2, column=1, sticky=tk.W, padx=5)
+            
+            # Status indicators
+            status_frame = ttk.Frame(pipeline_frame)
+            status_frame.pack(fill=tk.X, padx=5, pady=5)
+            
+            pc_var = tk.StringVar(value="PC: 0x0000")
+            stall_var = tk.StringVar(value="Stall: No")
+            flush_var = tk.StringVar(value="Flush: No")
+            
+            ttk.Label(status_frame, textvariable=pc_var).pack(side=tk.LEFT, padx=5)
+            ttk.Label(status_frame, textvariable=stall_var).pack(side=tk.LEFT, padx=5)
+            ttk.Label(status_frame, textvariable=flush_var).pack(side=tk.LEFT, padx=5)
+            
+            # Register frame
+            register_frame = ttk.LabelFrame(thread_frame, text="Registers")
+            register_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+            
+            # Create register display with scrolling
+            reg_display = self._create_dump_text(register_frame, height=10)
+            
+            # Create a dict to hold all variables for this thread
+            self.thread_frames[(core_id, thread_id)] = {
+                'fetch': fetch_var,
+                'decode': decode_var,
+                'execute': execute_var,
+                'pc': pc_var,
+                'stall': stall_var,
+                'flush': flush_var,
+                'registers': reg_display
+            }
+
+    def _on_core_tab_changed(self, event):
+        core_id = self.core_tabs.index("current")
+        if core_id not in self._built_cores:
+            self._build_thread_widgets(core_id)
+            for thread_id in range(NUM_THREADS_PER_CORE):
+                self._update_thread_display(core_id, thread_id)
+
+    def _create_dump_text(self, parent, **kwargs):
+        # Fixed-width dumps are edited row by row, so they need neither wrapping nor the
+        # undo history ScrolledText keeps growing with every edit
+        frame = ttk.Frame(parent)
+        frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        text = tk.Text(frame, wrap=tk.NONE, undo=False, autoseparators=False, **kwargs)
+        scrollbar = ttk.Scrollbar(frame, orient=tk.VERTICAL, command=text.yview)
+        text.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        return text
+
+    def _set_var(self, var, value):
+        # Each StringVar.set crosses into Tcl and redraws the label, so skip no-op updates
+        key = id(var)
+        if self._var_shadow.get(key) != value:
+            var.set(value)
+            self._var_shadow[key] = value
+
     def _update_thread_display(self, core_id, thread_id):
         thread = self.cores[core_id].threads[thread_id]
-        thread_vars = self.thread_frames[(core_id, thread_id)]
+        pipeline = thread.pipeline
+        registers = tuple(thread.state.registers)
+        snap = (thread.state.pc, thread.stall_detected, thread.flush_detected, registers,
+                pipeline['F'], pipeline['D'], pipeline['E'])
+        
+        # Nothing to redraw if this thread hasn't changed since the last render
+        key = (core_id, thread_id)
+        prev = self._thread_snapshots.get(key)
+        if snap == prev:
+            return
+        self._thread_snapshots[key] = snap
+        thread_vars = self.thread_frames[key]
+        pc, stall, flush, _, fetch, decode, execute = snap
         
         # Update pipeline status
-        thread_vars['fetch'].set(f"Fetch: {format_instruction(thread.pipeline['F'])}")
-        thread_vars['decode'].set(f"Decode: {format_instruction(thread.pipeline['D'])}")
-        thread_vars['execute'].set(f"Execute: {format_instruction(thread.pipeline['E'])}")
+        self._set_var(thread_vars['fetch'], f"Fetch: {format_instruction(fetch)}")
+        self._set_var(thread_vars['decode'], f"Decode: {format_instruction(decode)}")
+        self._set_var(thread_vars['execute'], f"Execute: {format_instruction(execute)}")
         
         # Update status indicators
-        thread_vars['pc'].set(f"PC: 0x{thread.state.pc:04x}")
-        thread_vars['stall'].set(f"Stall: {'Yes' if thread.stall_detected else 'No'}")
-        thread_vars['flush'].set(f"Flush: {'Yes' if thread.flush_detected else 'No'}")
+        self._set_var(thread_vars['pc'], f"PC: 0x{pc:04x}")
+        self._set_var(thread_vars['stall'], f"Stall: {'Yes' if stall else 'No'}")
+        self._set_var(thread_vars['flush'], f"Flush: {'Yes' if flush else 'No'}")
         
-        # Update registers
-        reg_text = ""
-        for i in range(0, len(thread.state.registers), 4):
-            reg_line = "  ".join([f"R{i+j}: 0x{thread.state.registers[i+j]:08x}" 
-                                for j in range(4) if i+j < len(thread.state.registers)])
-            reg_text += reg_line + "\n"
-        
-        thread_vars['registers'].delete(1.0, tk.END)
-        thread_vars['registers'].insert(tk.END, reg_text)
+        # Update registers, rewriting only the rows whose values changed
+        reg_display = thread_vars['registers']
+        if prev is None:
+            reg_display.insert(tk.END, "".join(
+                fmt % registers[row * 4:row * 4 + 4] + "\n"
+                for row, fmt in enumerate(self._reg_row_fmts)))
+            return
+        prev_registers = prev[3]
+        if prev_registers == registers:
+            return
+        for row, fmt in enumerate(self._reg_row_fmts):
+            values = registers[row * 4:row * 4 + 4]
+            if values != prev_registers[row * 4:row * 4 + 4]:
+                line = row + 1
+                reg_display.replace(f"{line}.0", f"{line}.end", fmt % values)
 
     def _update_memory_display(self):
-        memory_content = ""
-        # Display first 20 memory locations that are non-zero
-        count = 0
-        for i in range(0, 1024, 4):
-            value = self.memory_controller.read(i)
-            if value != 0 or count < 10:  # Show at least 10 entries
-                memory_content += f"0x{i:04x}: 0x{value:08x}\n"
-                count += 1
-            if count >= 20:
-                break
-                
-        self.memory_display.delete(1.0, tk.END)
-        self.memory_display.insert(tk.END, memory_content)
+        words = self.memory_controller.read_block(0, 1024 // 4)
+        if words == self._mem_words:
+            return
+        self._mem_words = words
+        
+        # Show the first 10 words, then up to 10 more non-zero ones; compress() does the
+        # zero-skipping scan in C
+        shown = itertools.chain(range(10), itertools.islice(
+            itertools.compress(range(10, len(words)), words[10:]), 10))
+        lines = ["0x%04x: 0x%08x" % (i * 4, words[i]) for i in shown]
+        
+        # Rewrite only the rows that changed, then append or trim the tail in one call
+        shown_count = len(self._mem_lines)
+        for i, text in enumerate(lines[:shown_count]):
+            if text != self._mem_lines[i]:
+                self.memory_display.replace(f"{i + 1}.0", f"{i + 1}.end", text)
+        if len(lines) > shown_count:
+            self.memory_display.insert(f"{shown_count + 1}.0", "".join(text + "\n" for text in lines[shown_count:]))
+        elif len(lines) < shown_count:
+            self.memory_display.delete(f"{len(lines) + 1}.0", tk.END)
+        self._mem_lines = lines
 
-    def _update_log_display(self):
-        log_content = ""
+    def _attach_logs(self):
         for core in self.cores:
             for thread in core.threads:
-                # Get the last 5 log entries for each thread
-                thread_logs = thread.log[-5:] if thread.log else []
-                for log in thread_logs:
-                    log_content += log + "\n"
-                
-        self.log_display.delete(1.0, tk.END)
-        self.log_display.insert(tk.END, log_content)
+                thread.log = _LogTap(self._log_buffer, core.core_id, thread.thread_id)
+
+    def _update_log_display(self):
+        entries = self._log_buffer
+        tail = entries[-1] if entries else None
+        if tail is self._log_tail:
+            return
+        # Anything older than the widget's line cap would be trimmed straight away
+        new_entries = []
+        for entry in itertools.islice(reversed(entries), LOG_DISPLAY_LINES):
+            if entry is self._log_tail:
+                break
+            new_entries.append(entry)
+        new_entries.reverse()
+        self._log_tail = tail
+        
+        self.log_display.insert(tk.END, "".join(entry + "\n" for entry in new_entries))
+        self._log_lines_shown += len(new_entries)
+        
+        # Trim the oldest lines once the widget grows past the cap
+        excess = self._log_lines_shown - LOG_DISPLAY_LINES
+        if excess > 0:
+            self.log_display.delete("1.0", f"{excess + 1}.0")
+            self._log_lines_shown -= excess
         self.log_display.see(tk.END)  # Scroll to see the latest logs
 
     def _update_all_displays(self):
-        for core_id in range(NUM_CORES):
+        # Hidden cores that were never shown have no panes to update
+        for core_id in self._built_cores:
             for thread_id in range(NUM_THREADS_PER_CORE):
                 self._update_thread_display(core_id, thread_id)
         
         self._update_memory_display()
         self._update_log_display()
+        self._last_render_ts = time.monotonic()
+
+    def _flush_render(self):
+        # Runs once Tk has drained pending events, so a burst of cycles renders once
+        if self._render_pending:
+            self._render_pending = False
+            self._update_all_displays()
+
+    def _request_render(self):
+        # Render immediately if nothing has been drawn recently, otherwise defer to idle time
+        if time.monotonic() - self._last_render_ts > UI_TICK_MS / 1000:
+            self._render_pending = False
+            self._update_all_displays()
+        elif not self._render_pending:
+            self._render_pending = True
+            self.master.after_idle(self._flush_render)
 
     def _run_simulation(self):
-        if self.running:
+        if self.running and not self.paused:
             return
             
-        self.running = True
-        self.pause_event.clear()
-        self.stop_event.clear()
-        
-        # Start a thread for each core
-        self.core_threads = []
-        for core_id, core in enumerate(self.cores):
-            t = threading.Thread(target=self._run_core, args=(core_id,))
-            self.core_threads.append(t)
-            t.start()
-            
-        # Update UI in a separate thread
-        ui_thread = threading.Thread(target=self._update_ui_thread)
-        ui_thread.daemon = True
-        ui_thread.start()
+        if not self.running:
+            self.running = True
+            self._active_cores = list(self.cores)
+        self.paused = False
+        self._schedule_cycle()
         
         self.status_bar.config(text="Running simulation...")
 
-    def _update_ui_thread(self):
-        while self.running and not self.stop_event.is_set():
-            self.master.after(100, self._update_all_displays)
-            time.sleep(0.1)
+    def _on_speed_change(self, value):
+        # Takes effect on the next scheduled cycle; fast speeds lean on the render debounce
+        self._speed = 10 ** float(value)
+        if self._speed > 1000:
+            # after() cannot tick faster than 1 ms, so run several cycles per tick instead
+            self._cycle_ms = 1
+            self._cycles_per_tick = math.ceil(self._speed / 1000)
+        else:
+            self._cycle_ms = round(1000 / self._speed)
+            self._cycles_per_tick = 1
+        self._show_speed()
 
-    def _run_core(self, core_id):
-        core = self.cores[core_id]
-        
-        while not self.stop_event.is_set():
-            if self.pause_event.is_set():
-                time.sleep(0.1)
-                continue
-                
-            # Run one cycle on the core
-            active = core.cycle()
-            
-            # If all threads are halted, stop this core
-            if not active:
-                break
-                
-            # Slow down simulation for visualization
-            time.sleep(0.2)
-            
-        if core_id == 0:  # Only need to check once if all cores are done
-            all_done = True
-            for core in self.cores:
-                for thread in core.threads:
-                    if not thread.state.halted:
-                        all_done = False
-                        break
-                        
-            if all_done:
-                self.master.after(0, self._simulation_complete)
+    def _show_speed(self):
+        if self._speed:
+            self.speed_label_var.set(f"{self._speed:.0f} cycles/s")
+        else:
+            self.speed_label_var.set("Max")
+
+    def _schedule_cycle(self):
+        self._after_id = self.master.after(self._cycle_ms, self._scheduler_step)
+
+    def _cancel_cycle(self):
+        if self._after_id is not None:
+            self.master.after_cancel(self._after_id)
+            self._after_id = None
+
+    def _scheduler_step(self):
+        self._after_id = None
+        for _ in range(self._cycles_per_tick):
+            if not self._advance_cycle():
+                return
+        self._request_render()
+        self._schedule_cycle()
+
+    def _advance_cycle(self):
+        # Cycle each core that still has a live thread once; returns False when all have halted
+        self._active_cores = [core for core in self._active_cores if core.cycle()]
+        if not self._active_cores:
+            self._simulation_complete()
+            return False
+        return True
 
     def _pause_simulation(self):
-        if not self.running:
+        if not self.running or self.paused:
             return
             
-        self.pause_event.set()
+        self.paused = True
+        self._cancel_cycle()
         self.status_bar.config(text="Simulation paused")
 
     def _step_simulation(self):
@@ -303,24 +461,17 @@ class InteractivePhase5SimulatorGUI:
             self._update_all_displays()
             
         # If running but paused, do a single step
-        elif self.pause_event.is_set():
-            self.pause_event.clear()
-            time.sleep(0.1)  # Allow core to take one step
-            self.pause_event.set()
-            self._update_all_displays()
+        elif self.paused:
+            if self._advance_cycle():
+                self._update_all_displays()
 
     def _stop_simulation(self):
         if not self.running:
             return
             
-        self.stop_event.set()
-        self.pause_event.clear()
-        
-        # Wait for all threads to finish
-        for t in self.core_threads:
-            t.join(timeout=1.0)
-            
+        self._cancel_cycle()
         self.running = False
+        self.paused = False
         self.status_bar.config(text="Simulation stopped")
         self._update_all_displays()
 
@@ -329,9 +480,17 @@ class InteractivePhase5SimulatorGUI:
         if self.running:
             self._stop_simulation()
             
-        # Create new cores and memory controller
-        self.memory_controller = MemoryController()
-        self.cores = [Core(i, self.memory_controller) for i in range(NUM_CORES)]
+        # Reset cores and memory in place
+        self.memory_controller.clear()
+        for core in self.cores:
+            core.reset()
+        
+        # Start a fresh log; thread resets replaced the tapped logs
+        self._log_buffer.clear()
+        self._log_tail = None
+        self._log_lines_shown = 0
+        self.log_display.delete(1.0, tk.END)
+        self._attach_logs()
         
         # Load example program on all cores
         for core in self.cores:
@@ -343,6 +502,7 @@ class InteractivePhase5SimulatorGUI:
 
     def _simulation_complete(self):
         self.running = False
+        self.paused = False
         self.status_bar.config(text="Simulation complete")
         self._update_all_displays()
 
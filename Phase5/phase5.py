@@ -1,8 +1,9 @@
+import operator
 import sys
 import threading
 import time
 from dataclasses import dataclass
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Set, Tuple
 import argparse
 
 MEMORY_SIZE = 1024  # 1024-byte shared memory
@@ -10,6 +11,47 @@ NUM_CORES = 2
 NUM_THREADS_PER_CORE = 2
 DEBUG = False  # Main debug flag
 DEBUG_LEVEL = 1  # Debug verbosity level: 0=None, 1=Basic, 2=Detailed, 3=Verbose
+NOP = 0b0000 << 28  # Encoded NOP word, used to pad test programs
+
+ALU_OPS = {
+    "ADD": operator.add,
+    "SUB": operator.sub,
+    "MUL": operator.mul,
+    "DIV": operator.floordiv,
+    "AND": operator.and_,
+    "OR": operator.or_,
+    "XOR": operator.xor,
+}
+CARRY_OPS = frozenset({"ADD", "SUB", "MUL"})  # Ops whose unmasked result sets C
+
+
+def make_instruction(
+    opcode: int, rd: int = 0, rs: int = 0, rt: int = 0, address_or_operand: int = 0
+) -> int:
+    return (
+        (opcode << 28)
+        | (rd << 24)
+        | (rs << 20)
+        | (rt << 16)
+        | (address_or_operand & 0xFFFF)
+    )
+
+
+class Flags:
+    """Condition flags held in slots; repr and as_dict() give the old dict view for display"""
+
+    __slots__ = ("Z", "C", "N")
+
+    def __init__(self, Z: bool = False, C: bool = False, N: bool = False):
+        self.Z = Z
+        self.C = C
+        self.N = N
+
+    def as_dict(self) -> Dict[str, bool]:
+        return {"Z": self.Z, "C": self.C, "N": self.N}
+
+    def __repr__(self):
+        return repr(self.as_dict())
 
 
 @dataclass
@@ -17,7 +59,7 @@ class CPUState:
     registers: List[int]
     pc: int
     stack: List[int]
-    flags: Dict[str, bool]
+    flags: Flags
     memory: Dict[int, int]
     halted: bool = False
 
@@ -25,41 +67,89 @@ class CPUState:
 class InstructionSetSimulator:
     """Base simulator class with common functionality"""
 
+    # (opcode, handler name); _build_dispatch turns this into the per-class dispatch list
+    _OPCODE_SPEC = (
+        (0b0000, "nop"),  # No operation
+        (0b0001, "call"),
+        (0b0010, "ret"),
+        (0b0011, "halt"),
+        (0b0100, "push"),
+        (0b0101, "pop"),
+        (0b0110, "beq"),
+        (0b0111, "cmp"),
+        (0b1000, "add"),
+        (0b1001, "sub"),
+        (0b1010, "mul"),
+        (0b1011, "div"),
+        (0b1100, "load"),
+        (0b1101, "mov"),
+        (0b1110, "xor_op"),
+        (0b1111, "and_op"),
+        (0b10000, "store"),  # Add STORE operation
+    )
+
     def __init__(self):
         self.state = CPUState(
             registers=[0] * 16,
             pc=0,
             stack=[],
-            flags={"Z": False, "C": False, "N": False},
+            flags=Flags(),
             memory={},
         )
-        self.opcodes = {
-            0b0000: self.nop,  # No operation
-            0b0001: self.call,
-            0b0010: self.ret,
-            0b0011: self.halt,
-            0b0100: self.push,
-            0b0101: self.pop,
-            0b0110: self.beq,
-            0b0111: self.cmp,
-            0b1000: self.add,
-            0b1001: self.sub,
-            0b1010: self.mul,
-            0b1011: self.div,
-            0b1100: self.load,
-            0b1101: self.mov,
-            0b1110: self.xor_op,
-            0b1111: self.and_op,
-            0b10000: self.store,  # Add STORE operation
-        }
+        self._build_dispatch()
         self.current_instruction = 0
         self.log: List[str] = []
-        self.breakpoints: List[int] = []
+        self.log_enabled = True  # Set False to skip per-instruction log formatting
+        self.breakpoints: Set[int] = set()
         self.step_count = 0
 
-    def nop(self):
+    @classmethod
+    def _build_dispatch(cls):
+        """Build the opcode-indexed dispatch list and decode cache once per class
+
+        Both hold plain functions, so every instance of a class shares them and
+        handlers are called as handler(self, rd, rs, rt, imm).
+        """
+        if "_dispatch" in cls.__dict__:
+            return
+        dispatch = [None] * 32
+        for opcode, name in cls._OPCODE_SPEC:
+            dispatch[opcode] = getattr(cls, name)
+        cls._dispatch = dispatch
+        cls._decode_cache: Dict[int, Tuple] = {}
+
+    def _decode(self, instruction: int) -> Tuple:
+        """Split an instruction word into (handler, rd, rs, rt, imm), caching the result per word
+
+        imm is the sign-extended 16-bit field; handlers that want it unsigned mask it with 0xFFFF.
+        """
+        entry = self._decode_cache.get(instruction)
+        if entry is None:
+            opcode = (instruction >> 28) & 0b1111
+            handler = self._dispatch[opcode]
+            if handler is None:
+                raise Exception(f"Unknown opcode: {opcode:04b}")
+            entry = self._decode_cache[instruction] = (
+                handler,
+                (instruction >> 24) & 0b1111,
+                (instruction >> 20) & 0b1111,
+                (instruction >> 16) & 0b1111,
+                (instruction & 0xFFFF) - ((instruction & 0x8000) << 1),
+            )
+        return entry
+
+    def _predecode(self, program: List[int]):
+        """Fill the decode cache for every word of a program that decodes to a known opcode"""
+        cache = self._decode_cache
+        dispatch = self._dispatch
+        for instr in program:
+            if instr not in cache and dispatch[(instr >> 28) & 0b1111] is not None:
+                self._decode(instr)
+
+    def nop(self, rd, rs, rt, imm):
         """No operation"""
-        self.log.append(f"[{self.step_count}] NOP")
+        if self.log_enabled:
+            self.log.append(f"[{self.step_count}] NOP")
 
     def reset(self):
         """Reset the simulator to initial state"""
@@ -68,7 +158,7 @@ class InstructionSetSimulator:
             registers=[0] * 16,
             pc=0,
             stack=[],
-            flags={"Z": False, "C": False, "N": False},
+            flags=Flags(),
             memory=memory_copy,
         )
         self.log = []
@@ -76,148 +166,144 @@ class InstructionSetSimulator:
 
     def load_program(self, program: List[int], start_addr: int = 0):
         """Load program into memory starting at specified address"""
-        for offset, instr in enumerate(program):
-            self.state.memory[start_addr + offset * 4] = instr
-
-    def call(self):
-        addr = self.current_instruction & 0xFFFF
-        self.state.stack.append(self.state.pc)
-        self.state.pc = addr
-        self.log.append(f"[{self.step_count}] CALL 0x{addr:04x}")
-
-    def ret(self):
-        if not self.state.stack:
+        self.state.memory.update(
+            zip(range(start_addr, start_addr + len(program) * 4, 4), program)
+        )
+        self._predecode(program)
+
+    def call(self, rd, rs, rt, imm):
+        addr = imm & 0xFFFF
+        state = self.state
+        state.stack.append(state.pc)
+        state.pc = addr
+        if self.log_enabled:
+            self.log.append(f"[{self.step_count}] CALL 0x{addr:04x}")
+
+    def ret(self, rd, rs, rt, imm):
+        state = self.state
+        try:
+            return_addr = state.stack.pop()
+        except IndexError:
             self.log.append(f"[{self.step_count}] RET ERROR: Stack underflow!")
             raise Exception("RET called with empty stack")
-        return_addr = self.state.stack.pop()
-        self.state.pc = return_addr
-        self.log.append(f"[{self.step_count}] RET to 0x{return_addr:08x}")
+        state.pc = return_addr
+        if self.log_enabled:
+            self.log.append(f"[{self.step_count}] RET to 0x{return_addr:08x}")
 
-    def halt(self):
+    def halt(self, rd, rs, rt, imm):
         self.state.halted = True
-        self.log.append(f"[{self.step_count}] HALT")
+        if self.log_enabled:
+            self.log.append(f"[{self.step_count}] HALT")
 
-    def push(self):
-        reg = (self.current_instruction >> 24) & 0b1111
-        if reg >= len(self.state.registers):
+    def push(self, rd, rs, rt, imm):
+        reg = rd
+        registers = self.state.registers
+        if reg >= len(registers):
             raise Exception(f"Invalid register R{reg}")
-        self.state.stack.append(self.state.registers[reg])
-        self.log.append(
-            f"[{self.step_count}] PUSH R{reg} (0x{self.state.registers[reg]:08x})"
-        )
-
-    def pop(self):
-        if not self.state.stack:
+        value = registers[reg]
+        self.state.stack.append(value)
+        if self.log_enabled:
+            self.log.append(f"[{self.step_count}] PUSH R{reg} (0x{value:08x})")
+
+    def pop(self, rd, rs, rt, imm):
+        reg = rd
+        registers = self.state.registers
+        if reg >= len(registers):
+            raise Exception(f"Invalid register R{reg}")
+        try:
+            value = self.state.stack.pop()
+        except IndexError:
             self.log.append(f"[{self.step_count}] POP ERROR: Stack underflow!")
             raise Exception("POP called with empty stack")
-        reg = (self.current_instruction >> 24) & 0b1111
-        if reg >= len(self.state.registers):
-            raise Exception(f"Invalid register R{reg}")
-        self.state.registers[reg] = self.state.stack.pop()
-        self.log.append(
-            f"[{self.step_count}] POP R{reg} (0x{self.state.registers[reg]:08x})"
-        )
-
-    def beq(self):
-        rs = (self.current_instruction >> 20) & 0b1111
-        offset = self.current_instruction & 0xFFFF
-        if offset & 0x8000:
-            offset = offset - 0x10000
-        if self.state.flags["Z"]:  # Changed to check Z flag instead of register value
-            self.state.pc = (self.state.pc - 4) + offset
-            self.log.append(
-                f"[{self.step_count}] BEQ branch taken to PC=0x{self.state.pc:08x}"
-            )
+        registers[reg] = value
+        if self.log_enabled:
+            self.log.append(f"[{self.step_count}] POP R{reg} (0x{value:08x})")
+
+    def beq(self, rd, rs, rt, imm):
+        if self.state.flags.Z:  # Changed to check Z flag instead of register value
+            self.state.pc = (self.state.pc - 4) + imm
+            if self.log_enabled:
+                self.log.append(
+                    f"[{self.step_count}] BEQ branch taken to PC=0x{self.state.pc:08x}"
+                )
         else:
-            self.log.append(f"[{self.step_count}] BEQ no branch")
-
-    def cmp(self):
-        rs = (self.current_instruction >> 20) & 0b1111
-        rt = (self.current_instruction >> 16) & 0b1111
-        a = self.state.registers[rs]
-        b = self.state.registers[rt]
+            if self.log_enabled:
+                self.log.append(f"[{self.step_count}] BEQ no branch")
+
+    def cmp(self, rd, rs, rt, imm):
+        state = self.state
+        registers = state.registers
+        a = registers[rs]
+        b = registers[rt]
         result = a - b
-        self.state.flags["Z"] = result == 0
-        self.state.flags["N"] = ((result >> 31) & 1) == 1
-        self.state.flags["C"] = b > a
-        self.log.append(
-            f"[{self.step_count}] CMP R{rs}(0x{a:08x}) with R{rt}(0x{b:08x})"
-        )
+        flags = state.flags
+        flags.Z = result == 0
+        flags.N = (result & 0xFFFFFFFF) >> 31 == 1
+        flags.C = result < 0
+        if self.log_enabled:
+            self.log.append(
+                f"[{self.step_count}] CMP R{rs}(0x{a:08x}) with R{rt}(0x{b:08x})"
+            )
 
     def alu_operation(self, op: str, rd: int, rs: int, rt: int):
-        a = self.state.registers[rs]
-        b = self.state.registers[rt]
-        if op == "ADD":
-            result = a + b
-            self.state.flags["C"] = result > 0xFFFFFFFF
-        elif op == "SUB":
-            result = a - b
-            self.state.flags["C"] = b > a
-        elif op == "MUL":
-            result = a * b
-            self.state.flags["C"] = result > 0xFFFFFFFF
-        elif op == "DIV":
-            if b == 0:
-                raise Exception("Division by zero")
-            result = a // b
-        elif op == "AND":
-            result = a & b
-        elif op == "OR":
-            result = a | b
-        elif op == "XOR":
-            result = a ^ b
-        else:
+        state = self.state
+        registers = state.registers
+        a = registers[rs]
+        b = registers[rt]
+        func = ALU_OPS.get(op)
+        if func is None:
             raise Exception(f"Unknown ALU operation: {op}")
-        result = result & 0xFFFFFFFF
-        self.state.registers[rd] = result
-        self.state.flags["Z"] = result == 0
-        self.state.flags["N"] = ((result >> 31) & 1) == 1
-        self.log.append(
-            f"[{self.step_count}] {op} R{rd}=R{rs}(0x{a:08x}) {op} R{rt}(0x{b:08x}) = 0x{result:08x}"
-        )
+        if op == "DIV" and b == 0:
+            raise Exception("Division by zero")
+        result = func(a, b)
+        flags = state.flags
+        if op in CARRY_OPS:
+            # Anything outside 32 bits is a carry (ADD/MUL) or a borrow (SUB)
+            flags.C = result >> 32 != 0
+        result &= 0xFFFFFFFF
+        registers[rd] = result
+        flags.Z = result == 0
+        flags.N = result >> 31 == 1
+        if self.log_enabled:
+            self.log.append(
+                f"[{self.step_count}] {op} R{rd}=R{rs}(0x{a:08x}) {op} R{rt}(0x{b:08x}) = 0x{result:08x}"
+            )
 
-    def add(self):
-        self.alu_operation("ADD", *self._decode_alu_operands())
+    def add(self, rd, rs, rt, imm):
+        self.alu_operation("ADD", rd, rs, rt)
 
-    def sub(self):
-        self.alu_operation("SUB", *self._decode_alu_operands())
+    def sub(self, rd, rs, rt, imm):
+        self.alu_operation("SUB", rd, rs, rt)
 
-    def mul(self):
-        self.alu_operation("MUL", *self._decode_alu_operands())
+    def mul(self, rd, rs, rt, imm):
+        self.alu_operation("MUL", rd, rs, rt)
 
-    def div(self):
-        self.alu_operation("DIV", *self._decode_alu_operands())
+    def div(self, rd, rs, rt, imm):
+        self.alu_operation("DIV", rd, rs, rt)
 
-    def and_op(self):
-        self.alu_operation("AND", *self._decode_alu_operands())
+    def and_op(self, rd, rs, rt, imm):
+        self.alu_operation("AND", rd, rs, rt)
 
-    def xor_op(self):
-        self.alu_operation("XOR", *self._decode_alu_operands())
+    def xor_op(self, rd, rs, rt, imm):
+        self.alu_operation("XOR", rd, rs, rt)
 
-    def mov(self):
-        rd = (self.current_instruction >> 24) & 0b1111
-        imm = self.current_instruction & 0xFFFF
-        if imm & 0x8000:
-            imm = imm | 0xFFFF0000
+    def mov(self, rd, rs, rt, imm):
+        imm &= 0xFFFFFFFF
         self.state.registers[rd] = imm
-        self.log.append(f"[{self.step_count}] MOV R{rd} = {imm}")
-
-    def load(self):
-        rd = (self.current_instruction >> 24) & 0b1111
-        rs = (self.current_instruction >> 20) & 0b1111
-        imm = self.current_instruction & 0xFFFF
-        addr = (self.state.registers[rs] + imm) & 0xFFFFFFFF
-        value = self.state.memory.get(addr, 0)
-        self.state.registers[rd] = value
-        self.log.append(
-            f"[{self.step_count}] LOAD R{rd} = MEM[R{rs} + {imm}] = {value}"
-        )
-
-    def _decode_alu_operands(self):
-        rd = (self.current_instruction >> 24) & 0b1111
-        rs = (self.current_instruction >> 20) & 0b1111
-        rt = (self.current_instruction >> 16) & 0b1111
-        return rd, rs, rt
+        if self.log_enabled:
+            self.log.append(f"[{self.step_count}] MOV R{rd} = {imm}")
+
+    def load(self, rd, rs, rt, imm):
+        imm &= 0xFFFF
+        state = self.state
+        registers = state.registers
+        addr = (registers[rs] + imm) & 0xFFFFFFFF
+        value = state.memory.get(addr, 0)
+        registers[rd] = value
+        if self.log_enabled:
+            self.log.append(
+                f"[{self.step_count}] LOAD R{rd} = MEM[R{rs} + {imm}] = {value}"
+            )
 
     def print_state(self):
         print("\n" + "=" * 60)
@@ -243,41 +329,38 @@ class InstructionSetSimulator:
             ]
             print("  ".join(regs))
 
-    def store(self):
+    def store(self, rd, rs, rt, imm):
         """Store register value to memory address"""
-        rd = (self.current_instruction >> 24) & 0b1111
-        rs = (self.current_instruction >> 20) & 0b1111
-        rt = (self.current_instruction >> 16) & 0b1111
-        addr = self.state.registers[rs]
-        value = self.state.registers[rt]
-        self.state.memory[addr] = value
-        self.log.append(
-            f"[{self.step_count}] STORE MEM[R{rs}(0x{addr:08x})] = R{rt}(0x{value:08x})"
-        )
+        state = self.state
+        addr = state.registers[rs]
+        value = state.registers[rt]
+        state.memory[addr] = value
+        if self.log_enabled:
+            self.log.append(
+                f"[{self.step_count}] STORE MEM[R{rs}(0x{addr:08x})] = R{rt}(0x{value:08x})"
+            )
 
 
 class Phase3Simulator(InstructionSetSimulator):
     """Phase 3 - Basic non-pipelined simulator"""
 
-    def __init__(self):
-        super().__init__()
-        self.opcodes = {
-            0b0000: self.nop,  # No operation
-            0b0001: self.call,  # Function call
-            0b0010: self.ret,  # Return from function
-            0b0011: self.halt,  # Halt the CPU
-            0b0100: self.push,  # Push register to stack
-            0b0101: self.pop,  # Pop from stack to register
-            0b0110: self.beq,  # Branch if Equal (Z flag)
-            0b0111: self.cmp,  # Compare instruction
-            0b1000: self.add,  # Addition
-            0b1001: self.sub,  # Subtraction
-            0b1010: self.mul,  # Multiplication
-            0b1011: self.div,  # Division
-            0b1100: self.and_op,  # Bitwise AND
-            0b1101: self.or_op,  # Bitwise OR
-            0b1110: self.xor_op,  # Bitwise XOR
-        }
+    _OPCODE_SPEC = (
+        (0b0000, "nop"),  # No operation
+        (0b0001, "call"),  # Function call
+        (0b0010, "ret"),  # Return from function
+        (0b0011, "halt"),  # Halt the CPU
+        (0b0100, "push"),  # Push register to stack
+        (0b0101, "pop"),  # Pop from stack to register
+        (0b0110, "beq"),  # Branch if Equal (Z flag)
+        (0b0111, "cmp"),  # Compare instruction
+        (0b1000, "add"),  # Addition
+        (0b1001, "sub"),  # Subtraction
+        (0b1010, "mul"),  # Multiplication
+        (0b1011, "div"),  # Division
+        (0b1100, "and_op"),  # Bitwise AND
+        (0b1101, "or_op"),  # Bitwise OR
+        (0b1110, "xor_op"),  # Bitwise XOR
+    )
 
     def show_test_menu(self):
         """Display test menu and run selected test with proper return"""
@@ -303,23 +386,24 @@ class Phase3Simulator(InstructionSetSimulator):
             else:
                 print("Invalid choice. Please try again.")
 
-    def or_op(self):
+    def or_op(self, rd, rs, rt, imm):
         """Bitwise OR operation"""
-        self.alu_operation("OR", *self._decode_alu_operands())
+        self.alu_operation("OR", rd, rs, rt)
 
     def fetch(self):
-        if self.state.pc in self.state.memory:
-            self.current_instruction = self.state.memory[self.state.pc]
-            self.state.pc += 4
-        else:
-            raise Exception(f"Invalid PC address: 0x{self.state.pc:08x}")
+        state = self.state
+        instruction = state.memory.get(state.pc)
+        if instruction is None:
+            raise Exception(f"Invalid PC address: 0x{state.pc:08x}")
+        self.current_instruction = instruction
+        state.pc += 4
 
     def decode_execute(self):
-        opcode = (self.current_instruction >> 28) & 0b1111
-        if opcode in self.opcodes:
-            self.opcodes[opcode]()
-        else:
-            raise Exception(f"Unknown opcode: {opcode:04b}")
+        entry = self._decode_cache.get(self.current_instruction)
+        if entry is None:
+            entry = self._decode(self.current_instruction)
+        handler, rd, rs, rt, imm = entry
+        handler(self, rd, rs, rt, imm)
         self.step_count += 1
 
     def run(
@@ -330,24 +414,51 @@ class Phase3Simulator(InstructionSetSimulator):
         debug: bool = False,
     ):
         self.state.pc = start_addr
-        while not self.state.halted and self.step_count < max_steps:
-            try:
-                if self.state.pc in self.breakpoints:
-                    print(f"Breakpoint hit at 0x{self.state.pc:08x}")
-                    if interactive:
-                        self.interactive_debug()
-                self.fetch()
-                self.decode_execute()
-                if debug:
-                    self.print_state()
+        try:
+            if interactive or debug or self.breakpoints:
+                self._run_traced(max_steps, interactive, debug)
+            else:
+                self._run_fast(max_steps)
+        except Exception as e:
+            self.log.append(f"Execution stopped at step {self.step_count}: {str(e)}")
+            print(f"ERROR: {str(e)}")
+
+    def _run_traced(self, max_steps: int, interactive: bool, debug: bool):
+        """Step loop with breakpoint, state-dump and interactive debugger hooks"""
+        state = self.state
+        breakpoints = self.breakpoints
+        fetch = self.fetch
+        decode_execute = self.decode_execute
+        while not state.halted and self.step_count < max_steps:
+            if breakpoints and state.pc in breakpoints:
+                print(f"Breakpoint hit at 0x{state.pc:08x}")
                 if interactive:
                     self.interactive_debug()
-            except Exception as e:
-                self.log.append(
-                    f"Execution stopped at step {self.step_count}: {str(e)}"
-                )
-                print(f"ERROR: {str(e)}")
-                break
+            fetch()
+            decode_execute()
+            if debug:
+                self.print_state()
+            if interactive:
+                self.interactive_debug()
+
+    def _run_fast(self, max_steps: int):
+        """fetch + decode_execute fused into one loop with no per-step debugger hooks"""
+        state = self.state
+        memory = state.memory
+        cache = self._decode_cache
+        decode = self._decode
+        while not state.halted and self.step_count < max_steps:
+            instruction = memory.get(state.pc)
+            if instruction is None:
+                raise Exception(f"Invalid PC address: 0x{state.pc:08x}")
+            self.current_instruction = instruction
+            state.pc += 4
+            entry = cache.get(instruction)
+            if entry is None:
+                entry = decode(instruction)
+            handler, rd, rs, rt, imm = entry
+            handler(self, rd, rs, rt, imm)
+            self.step_count += 1
 
     def interactive_debug(self):
         self.print_state()
@@ -372,7 +483,7 @@ class Phase3Simulator(InstructionSetSimulator):
                 addr = input("Enter breakpoint address (hex): ")
                 try:
                     addr = int(addr, 16)
-                    self.breakpoints.append(addr)
+                    self.breakpoints.add(addr)
                     print(f"Breakpoint set at 0x{addr:08x}")
                 except ValueError:
                     print("Invalid address")
@@ -397,7 +508,7 @@ class Phase3Simulator(InstructionSetSimulator):
                 0b0101, rd=1
             ),  # 0x0008: POP R1 (added this instruction)
             self.make_instruction(0b0011),  # 0x000C: HALT
-            *([self.make_instruction(0b0000)] * ((0x100 // 4) - 4)),
+            *([NOP] * ((0x100 // 4) - 4)),
             self.make_instruction(0b0010),  # 0x0100: RET
         ]
         self.load_program(program)
@@ -429,14 +540,14 @@ class Phase3Simulator(InstructionSetSimulator):
                 0b0001, address_or_operand=0x0100
             ),  # 0x0000: CALL func1
             self.make_instruction(0b0011),  # 0x0004: HALT
-            *([self.make_instruction(0b0000)] * ((0x100 // 4) - 2)),
+            *([NOP] * ((0x100 // 4) - 2)),
             self.make_instruction(0b0100, rd=14),  # 0x0100: PUSH R14 (link register)
             self.make_instruction(
                 0b0001, address_or_operand=0x0200
             ),  # 0x0104: CALL func2
             self.make_instruction(0b0101, rd=14),  # 0x0108: POP R14
             self.make_instruction(0b0010),  # 0x010C: RET
-            *([self.make_instruction(0b0000)] * ((0x200 // 4) - (0x010C // 4 + 1))),
+            *([NOP] * ((0x200 // 4) - (0x010C // 4 + 1))),
             self.make_instruction(0b0010),  # 0x0200: RET
         ]
         self.load_program(program)
@@ -476,7 +587,7 @@ class Phase3Simulator(InstructionSetSimulator):
         print(f"R1 (5 + 3): {self.state.registers[1]} (Expected: 8)")  #
         print(f"R4 (8 - 2): {self.state.registers[4]} (Expected: 6)")  #
         print(
-            f"Flags: Z={self.state.flags['Z']}, N={self.state.flags['N']}, C={self.state.flags['C']}"
+            f"Flags: Z={self.state.flags.Z}, N={self.state.flags.N}, C={self.state.flags.C}"
         )  #
         print("\nExecution Log:")
         for entry in self.log:
@@ -521,21 +632,7 @@ class Phase3Simulator(InstructionSetSimulator):
         for entry in self.log[-10:]:
             print(entry)
 
-    def make_instruction(
-        self,
-        opcode: int,
-        rd: int = 0,
-        rs: int = 0,
-        rt: int = 0,
-        address_or_operand: int = 0,
-    ) -> int:
-        return (
-            (opcode << 28)
-            | (rd << 24)
-            | (rs << 20)
-            | (rt << 16)
-            | (address_or_operand & 0xFFFF)
-        )
+    make_instruction = staticmethod(make_instruction)
 
 
 class Phase4Simulator(InstructionSetSimulator):
@@ -544,94 +641,110 @@ class Phase4Simulator(InstructionSetSimulator):
     def __init__(self):
         super().__init__()
         self.pipeline = {"F": None, "D": None, "E": None}
+        self.is_idle = True  # All pipeline stages empty; kept current by fetch/pipeline_step
         self.stall_detected = False
         self.flush_detected = False
         self.pc_changed = False
-        self.modified_registers = set()
+        self._wb_reg = -1  # Register written back this cycle, -1 if none
 
-    def execute_instruction(self):
-        """Execute the current instruction in the pipeline"""
-        if self.pipeline["E"] is None:
-            return
+    def reset(self):
+        """Clear registers, memory, pipeline and log in place so the simulator can be reused"""
+        state = self.state
+        state.registers[:] = [0] * len(state.registers)
+        state.pc = 0
+        state.stack.clear()
+        flags = state.flags
+        flags.Z = flags.C = flags.N = False
+        state.memory.clear()
+        state.halted = False
+        self.pipeline.update(F=None, D=None, E=None)
+        self.is_idle = True
+        self.stall_detected = False
+        self.flush_detected = False
+        self.pc_changed = False
+        self._wb_reg = -1
+        self.current_instruction = 0
+        self.log.clear()
+        self.step_count = 0
 
-        opcode = (self.pipeline["E"] >> 28) & 0b1111
-        if opcode in self.opcodes:
-            self.current_instruction = self.pipeline["E"]
-            self.opcodes[opcode]()
-            # Track modified registers for hazard detection
-            if opcode in [
-                0b1000,
-                0b1001,
-                0b1010,
-                0b1011,
-                0b1100,
-                0b1101,
-                0b1110,
-                0b1111,
-            ]:
-                rd = (self.pipeline["E"] >> 24) & 0b1111
-                self.modified_registers.add(rd)
-        else:
-            raise Exception(f"Unknown opcode: {opcode:04b}")
+    def execute_instruction(self, instruction: Optional[int] = None):
+        """Execute an instruction, by default the one in the execute stage"""
+        if instruction is None:
+            instruction = self.pipeline["E"]
+            if instruction is None:
+                return
+
+        self.current_instruction = instruction
+        handler, rd, rs, rt, imm = self._decode(instruction)
+        handler(self, rd, rs, rt, imm)
+        # Track the written register for hazard detection; opcodes 0b1000-0b1111 write rd
+        if (instruction >> 28) & 0b1000:
+            self._wb_reg = rd
 
     # Rest of the Phase4Simulator class remains the same...
 
     def fetch(self):
-        if self.state.pc not in self.state.memory:
+        instruction = self.state.memory.get(self.state.pc)
+        if instruction is None:
             self.pipeline["F"] = None
+            self._update_idle()
             return
-        instruction = self.state.memory[self.state.pc]
         self.pipeline["F"] = instruction
+        self.is_idle = False
         self.state.pc += 4
 
+    def _update_idle(self):
+        pipeline = self.pipeline
+        self.is_idle = (
+            pipeline["F"] is None and pipeline["D"] is None and pipeline["E"] is None
+        )
+
     def pipeline_step(self):
         self.step_count += 1
-        self.modified_registers = set()
-        if self.has_data_hazard():
-            self.pipeline["E"] = None
+        self._wb_reg = -1
+        pipeline = self.pipeline
+        decode_instr = pipeline["D"]
+        if self.has_data_hazard(decode_instr, pipeline["E"]):
+            pipeline["E"] = execute_instr = None
             self.stall_detected = True
             self.flush_detected = False
-            self.log.append(f"[{self.step_count}] DATA HAZARD: Stall inserted")
+            if self.log_enabled:
+                self.log.append(f"[{self.step_count}] DATA HAZARD: Stall inserted")
         else:
             self.stall_detected = False
             self.flush_detected = False
-            self.pipeline["E"] = self.pipeline["D"]
-            self.pipeline["D"] = self.pipeline["F"]
+            pipeline["E"] = execute_instr = decode_instr
+            pipeline["D"] = pipeline["F"]
             self.fetch()
-        if self.pipeline["E"] is not None:
-            self.current_instruction = self.pipeline["E"]
-            self.execute_instruction()
+        if execute_instr is not None:
+            self.execute_instruction(execute_instr)
         if self.pc_changed:
-            self.pipeline["F"] = None
-            self.pipeline["D"] = None
+            pipeline["F"] = None
+            pipeline["D"] = None
             self.flush_detected = True
             self.stall_detected = False
             self.pc_changed = False
-            self.log.append(f"[{self.step_count}] CONTROL HAZARD: Pipeline flushed")
+            if self.log_enabled:
+                self.log.append(f"[{self.step_count}] CONTROL HAZARD: Pipeline flushed")
+        self._update_idle()
 
-    def has_data_hazard(self):
-        decode_instr = self.pipeline["D"]
-        execute_instr = self.pipeline["E"]
+    def has_data_hazard(self, decode_instr: Optional[int], execute_instr: Optional[int]):
         if decode_instr is None or execute_instr is None:
             return False
+        # Only the fields the decoded opcode actually reads are extracted
         d_opcode = (decode_instr >> 28) & 0b1111
-        d_rs = (decode_instr >> 20) & 0b1111
-        d_rt = (decode_instr >> 16) & 0b1111
-        e_opcode = (execute_instr >> 28) & 0b1111
-        e_rd = (execute_instr >> 24) & 0b1111
-        if d_opcode in [0b1000, 0b1001, 0b1010]:
-            if d_rs == e_rd or d_rt == e_rd:
-                return True
+        if d_opcode in (0b1000, 0b1001, 0b1010):
+            e_rd = (execute_instr >> 24) & 0b1111
+            return (decode_instr >> 20) & 0b1111 == e_rd or (decode_instr >> 16) & 0b1111 == e_rd
         if d_opcode == 0b0110:
-            if d_rs == e_rd:
-                return True
+            return (decode_instr >> 20) & 0b1111 == (execute_instr >> 24) & 0b1111
         return False
 
     def print_pipeline_status(self, cycle_num):
         print(f"\n=== Cycle {cycle_num} ===")
         print(f"PC: 0x{self.state.pc:08x}")
         print(
-            f"Flags: Z={self.state.flags['Z']}, N={self.state.flags['N']}, C={self.state.flags['C']}"
+            f"Flags: Z={self.state.flags.Z}, N={self.state.flags.N}, C={self.state.flags.C}"
         )
         print("\nPipeline Stages:")
         print(f"Fetch (F): {format_instruction(self.pipeline['F'])}")
@@ -643,7 +756,7 @@ class Phase4Simulator(InstructionSetSimulator):
             print("\nFLUSH Detected (Control Hazard)")
         print(
             "\nModified Registers:",
-            self.modified_registers if self.modified_registers else "None",
+            f"{{{self._wb_reg}}}" if self._wb_reg >= 0 else "None",
         )
 
     def run(
@@ -652,22 +765,26 @@ class Phase4Simulator(InstructionSetSimulator):
         max_steps: int = 100,
         interactive: bool = False,
         debug: bool = False,
+        cycle_delay: float = 0.0,
     ):
+        """Run the pipeline; debug prints each cycle and cycle_delay paces it (seconds)"""
         self.state.pc = start_addr
         for cycle in range(max_steps):
-            self.print_pipeline_status(cycle + 1)
-            time.sleep(1)
+            if debug:
+                self.print_pipeline_status(cycle + 1)
+            if cycle_delay:
+                time.sleep(cycle_delay)
             self.pipeline_step()
-            if (
-                self.pipeline["F"] is None
-                and self.pipeline["D"] is None
-                and self.pipeline["E"] is None
-            ):
+            if self.is_idle:
                 break
         print("\nSimulation Complete")
 
-    def run_matrix_multiplication(self):
-        """Run a parallelized matrix multiplication workload with detailed step-by-step output"""
+    def run_matrix_multiplication(self, slow_mode: bool = False):
+        """Run a parallelized matrix multiplication workload with detailed step-by-step output
+
+        Per-cycle status and the 0.5s readability delay are only produced
+        when ``slow_mode`` (or DEBUG) is set.
+        """
         print("\nStarting Matrix Multiplication Workload with Detailed Debugging...")
         shared_memory = MemoryController()
         shared_memory.enable_stats(True)
@@ -688,44 +805,26 @@ class Phase4Simulator(InstructionSetSimulator):
             [29, 30, 31, 32],
         ]
 
-        # Load matrices into memory
-        for i in range(matrix_size):
-            for j in range(matrix_size):
-                shared_memory.write(
-                    MATRIX_A_BASE + (i * matrix_size + j) * 4, matrix_a[i][j]
-                )
-                shared_memory.write(
-                    MATRIX_B_BASE + (i * matrix_size + j) * 4, matrix_b[i][j]
-                )
-                shared_memory.write(MATRIX_C_BASE + (i * matrix_size + j) * 4, 0)
+        # Load matrices into memory, one row-major block per matrix
+        shared_memory.bulk_load([v for row in matrix_a for v in row], MATRIX_A_BASE)
+        shared_memory.bulk_load([v for row in matrix_b for v in row], MATRIX_B_BASE)
+        shared_memory.bulk_load([0] * (matrix_size * matrix_size), MATRIX_C_BASE)
 
         # Print initial matrices
         def print_matrices():
             print("\nCurrent Matrices:")
-            print("Matrix A:")
-            for i in range(matrix_size):
-                print(
-                    [
-                        shared_memory.read(MATRIX_A_BASE + (i * matrix_size + j) * 4)
-                        for j in range(matrix_size)
-                    ]
-                )
-            print("Matrix B:")
-            for i in range(matrix_size):
-                print(
-                    [
-                        shared_memory.read(MATRIX_B_BASE + (i * matrix_size + j) * 4)
-                        for j in range(matrix_size)
-                    ]
-                )
-            print("Matrix C (Result):")
-            for i in range(matrix_size):
-                print(
-                    [
-                        shared_memory.read(MATRIX_C_BASE + (i * matrix_size + j) * 4)
-                        for j in range(matrix_size)
-                    ]
-                )
+            for title, base in (
+                ("Matrix A:", MATRIX_A_BASE),
+                ("Matrix B:", MATRIX_B_BASE),
+                ("Matrix C (Result):", MATRIX_C_BASE),
+            ):
+                print(title)
+                for i in range(matrix_size):
+                    print(
+                        shared_memory.read_block(
+                            base + i * matrix_size * 4, matrix_size
+                        )
+                    )
 
         print_matrices()
 
@@ -734,88 +833,96 @@ class Phase4Simulator(InstructionSetSimulator):
         total_threads = NUM_CORES * NUM_THREADS_PER_CORE
         rows_per_thread = max(1, matrix_size // total_threads)
 
+        # The programs differ only in the R0 = start_row load, so build the
+        # instruction stream once and patch that slot per thread
+        template = [
+            # Load constants
+            make_instruction(
+                0b1101, rd=7, address_or_operand=matrix_size
+            ),  # R7 = matrix_size
+            make_instruction(0b1101, rd=8, address_or_operand=MATRIX_A_BASE),
+            make_instruction(0b1101, rd=9, address_or_operand=MATRIX_B_BASE),
+            make_instruction(0b1101, rd=10, address_or_operand=MATRIX_C_BASE),
+            NOP,  # R0 = start_row, patched per thread
+            # Main computation loop
+            make_instruction(0b0111, rs=0, rt=7),  # CMP R0, R7 (i < matrix_size?)
+            make_instruction(
+                0b0110, address_or_operand=38 * 4
+            ),  # BEQ to end if done
+            # Initialize column counter (j)
+            make_instruction(0b1101, rd=1, address_or_operand=0),  # R1 = 0
+            # Column loop
+            make_instruction(0b0111, rs=1, rt=7),  # CMP R1, R7 (j < matrix_size?)
+            make_instruction(
+                0b0110, address_or_operand=32 * 4
+            ),  # BEQ to end of column loop
+            # Initialize sum and inner counter (k)
+            make_instruction(0b1101, rd=6, address_or_operand=0),  # R6 = 0 (sum)
+            make_instruction(0b1101, rd=2, address_or_operand=0),  # R2 = 0 (k)
+            # Inner product loop
+            make_instruction(0b0111, rs=2, rt=7),  # CMP R2, R7 (k < matrix_size?)
+            make_instruction(
+                0b0110, address_or_operand=20 * 4
+            ),  # BEQ to end of inner loop
+            # Load A[i][k]
+            make_instruction(0b1010, rd=3, rs=0, rt=7),  # R3 = i * matrix_size
+            make_instruction(0b1000, rd=3, rs=3, rt=2),  # R3 += k
+            make_instruction(0b1010, rd=3, rs=3, rt=15),  # R3 *= 4 (int size)
+            make_instruction(0b1000, rd=3, rs=3, rt=8),  # R3 += MATRIX_A_BASE
+            make_instruction(0b1100, rd=4, rs=3, rt=0),  # LOAD R4 = MEM[R3]
+            # Load B[k][j]
+            make_instruction(0b1010, rd=3, rs=2, rt=7),  # R3 = k * matrix_size
+            make_instruction(0b1000, rd=3, rs=3, rt=1),  # R3 += j
+            make_instruction(0b1010, rd=3, rs=3, rt=15),  # R3 *= 4
+            make_instruction(0b1000, rd=3, rs=3, rt=9),  # R3 += MATRIX_B_BASE
+            make_instruction(0b1100, rd=5, rs=3, rt=0),  # LOAD R5 = MEM[R3]
+            # Multiply and accumulate
+            make_instruction(0b1010, rd=3, rs=4, rt=5),  # R3 = A[i][k] * B[k][j]
+            make_instruction(0b1000, rd=6, rs=6, rt=3),  # sum += R3
+            # Increment k and loop
+            make_instruction(0b1101, rd=3, address_or_operand=1),
+            make_instruction(0b1000, rd=2, rs=2, rt=3),  # k++
+            make_instruction(
+                0b0001, address_or_operand=12 * 4
+            ),  # Jump back to inner loop
+            # Store result to C[i][j]
+            make_instruction(0b1010, rd=3, rs=0, rt=7),  # R3 = i * matrix_size
+            make_instruction(0b1000, rd=3, rs=3, rt=1),  # R3 += j
+            make_instruction(0b1010, rd=3, rs=3, rt=15),  # R3 *= 4
+            make_instruction(0b1000, rd=3, rs=3, rt=10),  # R3 += MATRIX_C_BASE
+            make_instruction(0b10000, rd=0, rs=3, rt=6),  # STORE MEM[R3] = R6 (sum)
+            # Increment j and loop
+            make_instruction(0b1101, rd=3, address_or_operand=1),
+            make_instruction(0b1000, rd=1, rs=1, rt=3),  # j++
+            make_instruction(
+                0b0001, address_or_operand=8 * 4
+            ),  # Jump back to column loop
+            # Increment i and loop
+            make_instruction(0b1101, rd=3, address_or_operand=1),
+            make_instruction(0b1000, rd=0, rs=0, rt=3),  # i++
+            make_instruction(
+                0b0001, address_or_operand=5 * 4
+            ),  # Jump back to start
+            make_instruction(0b0011),  # HALT
+        ]
+        start_row_slot = 4
+
         for thread_id in range(total_threads):
             start_row = thread_id * rows_per_thread
-            end_row = min(start_row + rows_per_thread, matrix_size)
-
-            program = [
-                # Load constants
-                make_instruction(
-                    0b1101, rd=7, address_or_operand=matrix_size
-                ),  # R7 = matrix_size
-                make_instruction(0b1101, rd=8, address_or_operand=MATRIX_A_BASE),
-                make_instruction(0b1101, rd=9, address_or_operand=MATRIX_B_BASE),
-                make_instruction(0b1101, rd=10, address_or_operand=MATRIX_C_BASE),
-                make_instruction(
-                    0b1101, rd=0, address_or_operand=start_row
-                ),  # R0 = start_row
-                # Main computation loop
-                make_instruction(0b0111, rs=0, rt=7),  # CMP R0, R7 (i < matrix_size?)
-                make_instruction(
-                    0b0110, address_or_operand=38 * 4
-                ),  # BEQ to end if done
-                # Initialize column counter (j)
-                make_instruction(0b1101, rd=1, address_or_operand=0),  # R1 = 0
-                # Column loop
-                make_instruction(0b0111, rs=1, rt=7),  # CMP R1, R7 (j < matrix_size?)
-                make_instruction(
-                    0b0110, address_or_operand=32 * 4
-                ),  # BEQ to end of column loop
-                # Initialize sum and inner counter (k)
-                make_instruction(0b1101, rd=6, address_or_operand=0),  # R6 = 0 (sum)
-                make_instruction(0b1101, rd=2, address_or_operand=0),  # R2 = 0 (k)
-                # Inner product loop
-                make_instruction(0b0111, rs=2, rt=7),  # CMP R2, R7 (k < matrix_size?)
-                make_instruction(
-                    0b0110, address_or_operand=20 * 4
-                ),  # BEQ to end of inner loop
-                # Load A[i][k]
-                make_instruction(0b1010, rd=3, rs=0, rt=7),  # R3 = i * matrix_size
-                make_instruction(0b1000, rd=3, rs=3, rt=2),  # R3 += k
-                make_instruction(0b1010, rd=3, rs=3, rt=15),  # R3 *= 4 (int size)
-                make_instruction(0b1000, rd=3, rs=3, rt=8),  # R3 += MATRIX_A_BASE
-                make_instruction(0b1100, rd=4, rs=3, rt=0),  # LOAD R4 = MEM[R3]
-                # Load B[k][j]
-                make_instruction(0b1010, rd=3, rs=2, rt=7),  # R3 = k * matrix_size
-                make_instruction(0b1000, rd=3, rs=3, rt=1),  # R3 += j
-                make_instruction(0b1010, rd=3, rs=3, rt=15),  # R3 *= 4
-                make_instruction(0b1000, rd=3, rs=3, rt=9),  # R3 += MATRIX_B_BASE
-                make_instruction(0b1100, rd=5, rs=3, rt=0),  # LOAD R5 = MEM[R3]
-                # Multiply and accumulate
-                make_instruction(0b1010, rd=3, rs=4, rt=5),  # R3 = A[i][k] * B[k][j]
-                make_instruction(0b1000, rd=6, rs=6, rt=3),  # sum += R3
-                # Increment k and loop
-                make_instruction(0b1101, rd=3, address_or_operand=1),
-                make_instruction(0b1000, rd=2, rs=2, rt=3),  # k++
-                make_instruction(
-                    0b0001, address_or_operand=12 * 4
-                ),  # Jump back to inner loop
-                # Store result to C[i][j]
-                make_instruction(0b1010, rd=3, rs=0, rt=7),  # R3 = i * matrix_size
-                make_instruction(0b1000, rd=3, rs=3, rt=1),  # R3 += j
-                make_instruction(0b1010, rd=3, rs=3, rt=15),  # R3 *= 4
-                make_instruction(0b1000, rd=3, rs=3, rt=10),  # R3 += MATRIX_C_BASE
-                make_instruction(0b10000, rd=0, rs=3, rt=6),  # STORE MEM[R3] = R6 (sum)
-                # Increment j and loop
-                make_instruction(0b1101, rd=3, address_or_operand=1),
-                make_instruction(0b1000, rd=1, rs=1, rt=3),  # j++
-                make_instruction(
-                    0b0001, address_or_operand=8 * 4
-                ),  # Jump back to column loop
-                # Increment i and loop
-                make_instruction(0b1101, rd=3, address_or_operand=1),
-                make_instruction(0b1000, rd=0, rs=0, rt=3),  # i++
-                make_instruction(
-                    0b0001, address_or_operand=5 * 4
-                ),  # Jump back to start
-                make_instruction(0b0011),  # HALT
-            ]
+            program = template.copy()
+            program[start_row_slot] = make_instruction(
+                0b1101, rd=0, address_or_operand=start_row
+            )
             programs.append(program)
 
+        # Nothing reads the per-thread logs unless the run is traced
+        verbose = DEBUG or slow_mode
+
         # Set R15 to 4 for all threads (for multiplication by 4)
         for core in cores:
             for thread in core.threads:
                 thread.state.registers[15] = 4
+                thread.log_enabled = verbose
 
         # Load programs
         for core_id in range(NUM_CORES):
@@ -832,16 +939,16 @@ class Phase4Simulator(InstructionSetSimulator):
                         f"Initial registers: {cores[core_id].threads[thread_id].state.registers}"
                     )
 
-        # Run simulation with detailed output
-        core_threads = []
-        for core in cores:
-
-            def core_runner(c):
-                cycle = 0
-                while cycle < 100:  # Max cycles
-                    cycle += 1
-                    print(f"\n=== Cycle {cycle} ===")
+        # Run simulation with detailed output, stepping the cores round-robin
+        running = list(cores)
+        cycle = 0
+        while running and cycle < 100:  # Max cycles
+            cycle += 1
+            if verbose:
+                print(f"\n=== Cycle {cycle} ===")
 
+            for c in list(running):
+                if verbose:
                     # Print core status
                     print(f"\nCore {c.core_id} Status:")
                     for t_idx, thread in enumerate(c.threads):
@@ -856,40 +963,41 @@ class Phase4Simulator(InstructionSetSimulator):
                         if thread.flush_detected:
                             print("    [FLUSH] Control hazard detected")
 
-                    # Execute one cycle
-                    if not c.cycle():
-                        break
-
-                    # Print matrix updates if any STORE occurred
-                    for t_idx, thread in enumerate(c.threads):
-                        if (
-                            thread.pipeline["E"]
-                            and ((thread.pipeline["E"] >> 28) & 0b1111) == 0b10000
-                        ):  # STORE op
-                            print(f"\nCore {c.core_id} Thread {t_idx} performed STORE:")
-                            print_matrices()
-
-                    time.sleep(0.5)  # Slow down for readability
-
-            t = threading.Thread(target=core_runner, args=(core,))
-            core_threads.append(t)
-            t.start()
-
-        for t in core_threads:
-            t.join()
-
-        # Verify results
+                # Execute one cycle
+                if not c.cycle():
+                    running.remove(c)
+                    continue
+
+                if not verbose:
+                    continue
+
+                # Print matrix updates if any STORE occurred
+                for t_idx, thread in enumerate(c.threads):
+                    if (
+                        thread.pipeline["E"]
+                        and ((thread.pipeline["E"] >> 28) & 0b1111) == 0b10000
+                    ):  # STORE op
+                        print(f"\nCore {c.core_id} Thread {t_idx} performed STORE:")
+                        print_matrices()
+
+            if slow_mode:
+                time.sleep(0.5)  # Slow down for readability
+
+        # Verify results. B is transposed once so both operands are walked
+        # row-wise; at this matrix size tiling would only add loop overhead.
+        columns_b = list(zip(*matrix_b))
         expected_c = [
-            [sum(a * b for a, b in zip(row_a, col_b)) for col_b in zip(*matrix_b)]
+            [sum(map(operator.mul, row_a, col_b)) for col_b in columns_b]
             for row_a in matrix_a
         ]
 
+        flat_c = shared_memory.read_block(MATRIX_C_BASE, matrix_size * matrix_size)
+        result_c = [
+            flat_c[i * matrix_size : (i + 1) * matrix_size] for i in range(matrix_size)
+        ]
+
         print("\nFinal Result Matrix C:")
-        for i in range(matrix_size):
-            row = []
-            for j in range(matrix_size):
-                addr = MATRIX_C_BASE + (i * matrix_size + j) * 4
-                row.append(shared_memory.read(addr))
+        for row in result_c:
             print(row)
 
         print("\nExpected Result:")
@@ -898,14 +1006,14 @@ class Phase4Simulator(InstructionSetSimulator):
 
         # Check for errors
         errors = 0
-        for i in range(matrix_size):
-            for j in range(matrix_size):
-                addr = MATRIX_C_BASE + (i * matrix_size + j) * 4
-                actual = shared_memory.read(addr)
-                expected = expected_c[i][j]
-                if actual != expected:
-                    print(f"Mismatch at C[{i}][{j}]: Expected {expected}, Got {actual}")
-                    errors += 1
+        if result_c != expected_c:
+            for i in range(matrix_size):
+                for j in range(matrix_size):
+                    actual = result_c[i][j]
+                    expected = expected_c[i][j]
+                    if actual != expected:
+                        print(f"Mismatch at C[{i}][{j}]: Expected {expected}, Got {actual}")
+                        errors += 1
 
         if errors == 0:
             print("\nMatrix multiplication completed successfully!")
@@ -916,6 +1024,13 @@ class Phase4Simulator(InstructionSetSimulator):
         shared_memory.print_stats()
 
 
+def _as_words(values):
+    """Return values truncated to 32 bits, skipping the per-item mask when all already fit"""
+    if not values or (0 <= min(values) and max(values) <= 0xFFFFFFFF):
+        return values
+    return [value & 0xFFFFFFFF for value in values]
+
+
 class MemoryController:
     """Optimized shared memory controller with synchronization for Phase 5"""
 
@@ -923,64 +1038,74 @@ class MemoryController:
         self.memory = [0] * size
         self.lock = threading.Lock()
 
-        # Use read-write lock pattern for better concurrency
-        self.read_locks = [threading.Lock() for _ in range(16)]  # Memory segment locks
-        self.write_lock = threading.Lock()  # Global write lock
+        # One lock per 64-byte segment, shared by readers and writers, so accesses
+        # to different segments never contend
+        self.segment_locks = [threading.Lock() for _ in range(16)]
 
-        # Cache frequently accessed memory locations
-        self.cache = {}
-        self.cache_size = 64  # Size of cache in entries
-        self.cache_lock = threading.Lock()
+        # 64-byte blocks filled by bulk_load, and those among them written since; clean
+        # code blocks are read by read_code without taking a lock
+        self._code_blocks: Set[int] = set()
+        self._dirty_code: Set[int] = set()
 
         # Memory access stats for profiling
         self.read_count = 0
         self.write_count = 0
-        self.cache_hits = 0
         self.stats_enabled = False
 
     def _get_segment(self, addr: int) -> int:
         """Get memory segment for address"""
-        return (addr // 64) % len(self.read_locks)
+        return (addr // 64) % len(self.segment_locks)
+
+    def _segment_runs(self, start_addr: int, count: int):
+        """Split count consecutive words from start_addr into (addr, index, n) runs, one per segment"""
+        end_addr = start_addr + count * 4
+        addr = start_addr
+        index = 0
+        while addr < end_addr:
+            segment_end = min(end_addr, (addr // 64 + 1) * 64)
+            n = (segment_end - addr + 3) // 4
+            yield addr, index, n
+            addr += n * 4
+            index += n
 
     def read(self, addr: int) -> int:
-        """Read memory with optimized locking and caching"""
-        # Check cache first
-        with self.cache_lock:
-            if addr in self.cache:
-                if self.stats_enabled:
-                    self.cache_hits += 1
-                    self.read_count += 1
-                return self.cache[addr]
-
-        # Cache miss, read from memory with segmented locking
+        """Read memory under the address's segment lock"""
         segment = self._get_segment(addr)
-        with self.read_locks[segment]:
+        with self.segment_locks[segment]:
             if 0 <= addr < len(self.memory):
-                value = self.memory[addr]
-
-                # Update cache
-                with self.cache_lock:
-                    if len(self.cache) >= self.cache_size:
-                        # Simple LRU: remove random entry when full
-                        if self.cache:
-                            self.cache.pop(next(iter(self.cache)))
-                    self.cache[addr] = value
-
                 if self.stats_enabled:
                     self.read_count += 1
-                return value
+                return self.memory[addr]
             return 0
 
+    def read_code(self, addr: int) -> int:
+        """Read an instruction word, lock-free unless its block was written after loading"""
+        if addr >> 6 in self._dirty_code or not 0 <= addr < len(self.memory):
+            return self.read(addr)
+        if self.stats_enabled:
+            self.read_count += 1
+        return self.memory[addr]
+
+    def read_block(self, start_addr: int, count: int) -> List[int]:
+        """Read count consecutive words, taking each segment lock once"""
+        if start_addr < 0 or start_addr + count * 4 > len(self.memory):
+            return [self.read(start_addr + i * 4) for i in range(count)]
+        words = []
+        for addr, _, n in self._segment_runs(start_addr, count):
+            with self.segment_locks[self._get_segment(addr)]:
+                words.extend(self.memory[addr : addr + n * 4 : 4])
+        if self.stats_enabled:
+            self.read_count += count
+        return words
+
     def write(self, addr: int, value: int) -> bool:
-        """Write to memory with write-through caching"""
-        # Use write lock for consistency
-        with self.write_lock:
+        """Write to memory under the address's segment lock"""
+        segment = self._get_segment(addr)
+        with self.segment_locks[segment]:
             if 0 <= addr < len(self.memory):
                 self.memory[addr] = value & 0xFFFFFFFF
-
-                # Update cache
-                with self.cache_lock:
-                    self.cache[addr] = value & 0xFFFFFFFF
+                if addr >> 6 in self._code_blocks:
+                    self._dirty_code.add(addr >> 6)
 
                 if self.stats_enabled:
                     self.write_count += 1
@@ -988,28 +1113,32 @@ class MemoryController:
             return False
 
     def bulk_load(self, program: List[int], start_addr: int = 0) -> bool:
-        """Efficiently load a block of memory"""
-        with self.write_lock:
-            if start_addr + len(program) * 4 > len(self.memory):
-                return False
-
-            # Update memory in a batch
-            for offset, instr in enumerate(program):
-                addr = start_addr + offset * 4
-                self.memory[addr] = instr & 0xFFFFFFFF
-
-                # Update cache for frequently accessed addresses
-                with self.cache_lock:
-                    self.cache[addr] = instr & 0xFFFFFFFF
-
-            if self.stats_enabled:
-                self.write_count += len(program)
-            return True
+        """Efficiently load a block of memory, taking each segment lock once"""
+        end_addr = start_addr + len(program) * 4
+        if end_addr > len(self.memory):
+            return False
 
-    def flush_cache(self):
-        """Clear the memory cache"""
-        with self.cache_lock:
-            self.cache.clear()
+        values = _as_words(program)
+        for addr, index, count in self._segment_runs(start_addr, len(program)):
+            with self.segment_locks[self._get_segment(addr)]:
+                self.memory[addr : addr + count * 4 : 4] = values[index : index + count]
+
+        if program:
+            blocks = range(start_addr >> 6, ((end_addr - 1) >> 6) + 1)
+            self._code_blocks.update(blocks)
+            self._dirty_code.difference_update(blocks)
+
+        if self.stats_enabled:
+            self.write_count += len(program)
+        return True
+
+    def clear(self):
+        """Zero memory in place and forget any loaded code blocks"""
+        self.memory[:] = [0] * len(self.memory)
+        self._code_blocks.clear()
+        self._dirty_code.clear()
+        self.read_count = 0
+        self.write_count = 0
 
     def print_stats(self):
         """Print memory access statistics"""
@@ -1019,11 +1148,6 @@ class MemoryController:
         print("\nMemory Controller Statistics:")
         print(f"  Total reads: {self.read_count}")
         print(f"  Total writes: {self.write_count}")
-        print(f"  Cache hits: {self.cache_hits}")
-        hit_rate = (
-            (self.cache_hits / self.read_count * 100) if self.read_count > 0 else 0
-        )
-        print(f"  Cache hit rate: {hit_rate:.2f}%")
 
     def enable_stats(self, enabled: bool = True):
         """Enable or disable statistics collection"""
@@ -1031,7 +1155,6 @@ class MemoryController:
         if not enabled:
             self.read_count = 0
             self.write_count = 0
-            self.cache_hits = 0
 
 
 class Core:
@@ -1042,22 +1165,24 @@ class Core:
         self.memory = memory
         self.threads: List[ThreadContext] = []
         self.active_thread_idx = 0
-        self.thread_lock = threading.Lock()
         for i in range(NUM_THREADS_PER_CORE):
             self.threads.append(ThreadContext(core_id, i, memory))
 
     def cycle(self) -> bool:
-        with self.thread_lock:
+        thread = self.threads[self.active_thread_idx]
+        if thread.state.halted:
+            self.active_thread_idx = (self.active_thread_idx + 1) % NUM_THREADS_PER_CORE
             thread = self.threads[self.active_thread_idx]
             if thread.state.halted:
-                self.active_thread_idx = (
-                    self.active_thread_idx + 1
-                ) % NUM_THREADS_PER_CORE
-                thread = self.threads[self.active_thread_idx]
-                if thread.state.halted:
-                    return False
-            thread.pipeline_step()
-            return True
+                return False
+        thread.pipeline_step()
+        return True
+
+    def reset(self):
+        """Reset every thread in place, keeping the shared memory controller"""
+        for thread in self.threads:
+            thread.reset()
+        self.active_thread_idx = 0
 
     def load_program(
         self, thread_id: int, program: List[int], start_addr: int = 0
@@ -1079,170 +1204,158 @@ class ThreadContext(InstructionSetSimulator):
             registers=[0] * 16,
             pc=0,
             stack=[],
-            flags={"Z": False, "C": False, "N": False},
+            flags=Flags(),
             memory={},
         )
         self.pipeline = {"F": None, "D": None, "E": None}
         self.stall_detected = False
         self.flush_detected = False
         self.pc_changed = False
-        self.modified_registers = set()
 
-    def execute_instruction(self):
-        """Execute the current instruction in the pipeline"""
-        if self.pipeline["E"] is None:
-            return
+    def execute_instruction(self, instruction: Optional[int] = None):
+        """Execute an instruction, by default the one in the execute stage"""
+        if instruction is None:
+            instruction = self.pipeline["E"]
+            if instruction is None:
+                return
 
-        opcode = (self.pipeline["E"] >> 28) & 0b1111
+        opcode = (instruction >> 28) & 0b1111
         if opcode == 0b10000:  # STORE operation (using 5 bits)
-            rd = (self.pipeline["E"] >> 24) & 0b1111
-            rs = (self.pipeline["E"] >> 20) & 0b1111
-            rt = (self.pipeline["E"] >> 16) & 0b1111
-            addr = self.state.registers[rs]
-            value = self.state.registers[rt]
+            registers = self.state.registers
+            addr = registers[(instruction >> 20) & 0b1111]
+            value = registers[(instruction >> 16) & 0b1111]
             success = self.memory.write(addr, value)
             if DEBUG:
                 print(
                     f"Core {self.core_id}.{self.thread_id} storing {value} at 0x{addr:08x} (success: {success})"
                 )
-            self.log.append(
-                f"[Core {self.core_id}.{self.thread_id}] STORE to 0x{addr:08x} = {value}"
-            )
-        elif opcode in self.opcodes:
-            self.opcodes[opcode]()
+            if self.log_enabled:
+                self.log.append(
+                    f"[Core {self.core_id}.{self.thread_id}] STORE to 0x{addr:08x} = {value}"
+                )
         else:
-            raise Exception(f"Unknown opcode: {opcode:04b}")
+            handler, rd, rs, rt, imm = self._decode(instruction)
+            handler(self, rd, rs, rt, imm)
+
+    def reset(self):
+        """Reset registers, pipeline and log; shared memory is left to the controller"""
+        super().reset()
+        self.pipeline = {"F": None, "D": None, "E": None}
+        self.stall_detected = False
+        self.flush_detected = False
+        self.pc_changed = False
 
     def load_program(self, program: List[int], start_addr: int = 0) -> bool:
         self.state.pc = start_addr
         return self.memory.bulk_load(program, start_addr)
 
     def fetch(self):
-        if self.state.pc >= MEMORY_SIZE:
+        state = self.state
+        if state.pc >= MEMORY_SIZE:
             self.pipeline["F"] = None
             return
-        instruction = self.memory.read(self.state.pc)
-        self.pipeline["F"] = instruction
-        self.state.pc += 4
+        self.pipeline["F"] = self.memory.read_code(state.pc)
+        state.pc += 4
 
     def pipeline_step(self):
         self.step_count += 1
-        self.modified_registers = set()
-        if DEBUG:
+        debug = DEBUG
+        pipeline = self.pipeline
+        if debug:
             print(f"\nCore {self.core_id}.{self.thread_id} Cycle {self.step_count}")
             print(
                 f"Pipeline before step: F={format_instruction(self.pipeline['F'])}, D={format_instruction(self.pipeline['D'])}, E={format_instruction(self.pipeline['E'])}"
             )
-        if self.has_data_hazard():
-            self.pipeline["E"] = None
+        decode_instr = pipeline["D"]
+        if self.has_data_hazard(decode_instr, pipeline["E"]):
+            pipeline["E"] = execute_instr = None
             self.stall_detected = True
             self.flush_detected = False
-            self.log.append(
-                f"[Core {self.core_id}.{self.thread_id}][{self.step_count}] DATA HAZARD: Stall inserted"
-            )
-            if DEBUG:
+            if self.log_enabled:
+                self.log.append(
+                    f"[Core {self.core_id}.{self.thread_id}][{self.step_count}] DATA HAZARD: Stall inserted"
+                )
+            if debug:
                 print("Data hazard detected - stalling")
         else:
             self.stall_detected = False
             self.flush_detected = False
-            self.pipeline["E"] = self.pipeline["D"]
-            self.pipeline["D"] = self.pipeline["F"]
+            pipeline["E"] = execute_instr = decode_instr
+            pipeline["D"] = pipeline["F"]
             self.fetch()
-        if self.pipeline["E"] is not None:
-            self.current_instruction = self.pipeline["E"]
-            if DEBUG:
-                print(f"Executing: {format_instruction(self.current_instruction)}")
-            self.execute_instruction()
+        if execute_instr is not None:
+            self.current_instruction = execute_instr
+            if debug:
+                print(f"Executing: {format_instruction(execute_instr)}")
+            self.execute_instruction(execute_instr)
         if self.pc_changed:
-            self.pipeline["F"] = None
-            self.pipeline["D"] = None
+            pipeline["F"] = None
+            pipeline["D"] = None
             self.flush_detected = True
             self.stall_detected = False
             self.pc_changed = False
-            self.log.append(
-                f"[Core {self.core_id}.{self.thread_id}][{self.step_count}] CONTROL HAZARD: Pipeline flushed"
-            )
-            if DEBUG:
+            if self.log_enabled:
+                self.log.append(
+                    f"[Core {self.core_id}.{self.thread_id}][{self.step_count}] CONTROL HAZARD: Pipeline flushed"
+                )
+            if debug:
                 print("Control hazard - pipeline flushed")
-        if DEBUG:
+        if debug:
             print(
                 f"Pipeline after step: F={format_instruction(self.pipeline['F'])}, D={format_instruction(self.pipeline['D'])}, E={format_instruction(self.pipeline['E'])}"
             )
             print(f"PC: 0x{self.state.pc:04x}")
             print(f"Registers: {self.state.registers}")
 
-    def has_data_hazard(self) -> bool:
-        if self.pipeline["D"] is None or self.pipeline["E"] is None:
+    def has_data_hazard(
+        self, decode_instr: Optional[int], execute_instr: Optional[int]
+    ) -> bool:
+        if decode_instr is None or execute_instr is None:
             return False
-        d_opcode = (self.pipeline["D"] >> 28) & 0b1111
-        d_rs = (self.pipeline["D"] >> 20) & 0b1111
-        d_rt = (self.pipeline["D"] >> 16) & 0b1111
-        e_opcode = (self.pipeline["E"] >> 28) & 0b1111
-        e_rd = (self.pipeline["E"] >> 24) & 0b1111
-        if d_opcode in [0b1000, 0b1001, 0b1010]:
-            if d_rs == e_rd or d_rt == e_rd:
-                return True
+        # Only the fields the decoded opcode actually reads are extracted
+        d_opcode = (decode_instr >> 28) & 0b1111
+        if d_opcode in (0b1000, 0b1001, 0b1010):
+            e_rd = (execute_instr >> 24) & 0b1111
+            return (decode_instr >> 20) & 0b1111 == e_rd or (decode_instr >> 16) & 0b1111 == e_rd
         if d_opcode == 0b1100:
-            if d_rs == e_rd:
-                return True
+            return (decode_instr >> 20) & 0b1111 == (execute_instr >> 24) & 0b1111
         return False
 
 
-def make_instruction(
-    opcode: int, rd: int = 0, rs: int = 0, rt: int = 0, address_or_operand: int = 0
-) -> int:
-    return (
-        (opcode << 28)
-        | (rd << 24)
-        | (rs << 20)
-        | (rt << 16)
-        | (address_or_operand & 0xFFFF)
-    )
+# Disassembly per opcode. Each formatter takes the instruction word and extracts
+# only the fields it prints.
+_FORMATTERS = (
+    None,  # 0b0000 has no mnemonic
+    lambda i: f"CALL 0x{i & 0xFFFF:04x}",
+    lambda i: "RET",
+    lambda i: "HALT",
+    lambda i: f"PUSH R{(i >> 24) & 0b1111}",
+    lambda i: f"POP R{(i >> 24) & 0b1111}",
+    lambda i: f"BEQ R{(i >> 20) & 0b1111}, #{i & 0xFFFF}",
+    lambda i: f"CMP R{(i >> 20) & 0b1111}, R{(i >> 16) & 0b1111}",
+    lambda i: f"ADD R{(i >> 24) & 0b1111}, R{(i >> 20) & 0b1111}, R{(i >> 16) & 0b1111}",
+    lambda i: f"SUB R{(i >> 24) & 0b1111}, R{(i >> 20) & 0b1111}, R{(i >> 16) & 0b1111}",
+    lambda i: f"MUL R{(i >> 24) & 0b1111}, R{(i >> 20) & 0b1111}, R{(i >> 16) & 0b1111}",
+    lambda i: f"DIV R{(i >> 24) & 0b1111}, R{(i >> 20) & 0b1111}, R{(i >> 16) & 0b1111}",
+    lambda i: f"LOAD R{(i >> 24) & 0b1111}, [R{(i >> 20) & 0b1111}+{i & 0xFFFF}]",
+    lambda i: (
+        f"MOV R{(i >> 24) & 0b1111}, #{i & 0xFFFF}"
+        if i & 0xFFFF < 10000
+        else f"MOV R{(i >> 24) & 0b1111}, #0x{i & 0xFFFF:04x}"
+    ),
+    lambda i: f"XOR R{(i >> 24) & 0b1111}, R{(i >> 20) & 0b1111}, R{(i >> 16) & 0b1111}",
+    lambda i: f"AND R{(i >> 24) & 0b1111}, R{(i >> 20) & 0b1111}, R{(i >> 16) & 0b1111}",
+)
 
 
 def format_instruction(instr):
     if instr is None:
         return "-"
     opcode = (instr >> 28) & 0b1111
-    rd = (instr >> 24) & 0b1111
-    rs = (instr >> 20) & 0b1111
-    rt = (instr >> 16) & 0b1111
-    imm = instr & 0xFFFF
-    if opcode == 0b0001:
-        return f"CALL 0x{imm:04x}"
-    elif opcode == 0b0010:
-        return f"RET"
-    elif opcode == 0b0011:
-        return "HALT"
-    elif opcode == 0b0100:
-        return f"PUSH R{rd}"
-    elif opcode == 0b0101:
-        return f"POP R{rd}"
-    elif opcode == 0b0110:
-        return f"BEQ R{rs}, #{imm}"
-    elif opcode == 0b0111:
-        return f"CMP R{rs}, R{rt}"
-    elif opcode == 0b1000:
-        return f"ADD R{rd}, R{rs}, R{rt}"
-    elif opcode == 0b1001:
-        return f"SUB R{rd}, R{rs}, R{rt}"
-    elif opcode == 0b1010:
-        return f"MUL R{rd}, R{rs}, R{rt}"
-    elif opcode == 0b1011:
-        return f"DIV R{rd}, R{rs}, R{rt}"
-    elif opcode == 0b1100:
-        return f"LOAD R{rd}, [R{rs}+{imm}]"
-    elif opcode == 0b1101:
-        if -10000 < imm < 10000:
-            return f"MOV R{rd}, #{imm}"
-        else:
-            return f"MOV R{rd}, #0x{imm & 0xFFFF:04x}"
-    elif opcode == 0b1110:
-        return f"XOR R{rd}, R{rs}, R{rt}"
-    elif opcode == 0b1111:
-        return f"AND R{rd}, R{rs}, R{rt}"
-    else:
+    formatter = _FORMATTERS[opcode]
+    if formatter is None:
         return f"Unknown OPCODE {opcode:04b}"
+    return formatter(instr)
 
 
 def run_phase3():
@@ -1268,10 +1381,10 @@ def run_phase4():
         make_instruction(0b0011),
     ]
     sim.load_program(program)
-    sim.run()
+    sim.run(debug=True, cycle_delay=1.0)
 
 
-def run_phase5():
+def run_phase5(slow_mode: bool = False):
     """Run the phase 5 (multicore) simulator"""
     print("\nStarting multicore simulation...")
     shared_memory = MemoryController()
@@ -1286,16 +1399,11 @@ def run_phase5():
     for core in cores:
         for thread_id in range(NUM_THREADS_PER_CORE):
             core.load_program(thread_id, program)
+            # Only the final registers are reported, so skip building log lines
+            core.threads[thread_id].log_enabled = DEBUG or slow_mode
             print(f"Loaded program on Core {core.core_id} Thread {thread_id}")
     print("\nStarting execution...")
-    core_threads = []
-    for core in cores:
-        t = threading.Thread(target=lambda c=core: run_core(c, 100))
-        core_threads.append(t)
-        t.start()
-        print(f"Started Core {core.core_id}")
-    for t in core_threads:
-        t.join()
+    run_cores(cores, 100, slow_mode)
     print("\nSimulation complete!")
     print("\nFinal register states:")
     for core in cores:
@@ -1304,13 +1412,19 @@ def run_phase5():
             thread.print_registers()
 
 
-def run_core(core: Core, cycles: int = 100):
+def run_cores(cores: List[Core], cycles: int = 100, slow_mode: bool = False):
+    """Step every core once per cycle until all are idle or ``cycles`` elapse"""
+    running = list(cores)
     for cycle in range(cycles):
-        if not core.cycle():
+        if not running:
             break
-        if DEBUG:
-            print(f"Core {core.core_id} cycle {cycle}")
-        time.sleep(0.01)
+        for core in list(running):
+            if not core.cycle():
+                running.remove(core)
+            elif DEBUG:
+                print(f"Core {core.core_id} cycle {cycle}")
+        if slow_mode:
+            time.sleep(0.01)
 
 
 def main():
@@ -1339,10 +1453,10 @@ def main():
 
                 subchoice = input("\nEnter your choice (1-3): ")
                 if subchoice == "1":
-                    run_phase5()
+                    run_phase5(slow_mode=True)
                 elif subchoice == "2":
                     sim = Phase4Simulator()
-                    sim.run_matrix_multiplication()
+                    sim.run_matrix_multiplication(slow_mode=True)
                 elif subchoice == "3":
                     break  # Return to main menu
                 else: